@@ -1,6 +1,7 @@
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Path, Query, Response
+from mqtransport import MQApp
 from starlette.status import *
 
 from api_gateway.app.api.models.integration_types import (
@@ -20,9 +21,10 @@ from api_gateway.app.database.orm import (
     ORMUser,
     Paginator,
 )
+from api_gateway.app.message_queue.instance import MQAppState
 
 from ...constants import *
-from ...depends import Operation, current_admin, get_db
+from ...depends import Operation, current_admin, get_db, get_mq
 from ...error_codes import *
 from ...error_model import ErrorModel, error_model, error_msg
 from ...utils import (
@@ -241,6 +243,7 @@ async def delete_integration_type(
     current_admin: ORMUser = Depends(current_admin),
     integration_type_id: ORMIntegrationTypeID = Path(...),
     db: IDatabase = Depends(get_db),
+    mq: MQApp = Depends(get_mq),
 ):
     def error_response(
         status_code: int, error_code: int, params: Optional[list] = None
@@ -268,6 +271,10 @@ async def delete_integration_type(
 
     await db.integration_types.delete(integration_type)
 
+    # Integrations of this type are removed in all projects
+    mq_state: MQAppState = mq.state
+    mq_state.integrations_cache.clear()
+
     log_operation_success(
         operation=operation,
         integration_type_id=integration_type_id,
@@ -5,6 +5,7 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Path, Query, Response
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from starlette.status import *
 
 from api_gateway.app.api.models.crashes import (
@@ -431,7 +432,11 @@ async def download_fuzzer_crash(
                 crash.input_id,
             )
 
-            response = StreamingResponse(chunks, media_type=media_type)
+            response = StreamingResponse(
+                chunks,
+                media_type=media_type,
+                background=BackgroundTask(chunks.aclose),
+            )
 
     except DBCrashNotFoundError:
         return error_response(HTTP_404_NOT_FOUND, E_CRASH_NOT_FOUND)
@@ -6,6 +6,7 @@ from typing import Any, Optional, Set
 from fastapi import APIRouter, Depends, Path, Query, Response
 from fastapi.responses import StreamingResponse
 from mqtransport import MQApp
+from starlette.background import BackgroundTask
 from starlette.status import *
 
 from api_gateway.app.api.models.fuzzers import (
@@ -658,7 +659,11 @@ async def download_fuzzer_corpus(
         return error_response(HTTP_404_NOT_FOUND, E_FILE_NOT_FOUND)
 
     log_operation_success(operation, fuzzer_id=fuzzer_id, caller=current_user.name)
-    return StreamingResponse(chunks, media_type="application/octet-stream")
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        background=BackgroundTask(chunks.aclose),
+    )
 
 
 ########################################
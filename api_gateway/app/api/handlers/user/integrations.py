@@ -4,6 +4,7 @@ from math import ceil
 from typing import Any, Optional, Set, Union
 
 from fastapi import APIRouter, Depends, Path, Query, Response
+from mqtransport import MQApp
 from starlette.status import *
 
 from api_gateway.app.api.models.integrations import (
@@ -30,6 +31,7 @@ from api_gateway.app.external_api.models import (
     JiraIntegrationModel,
     YoutrackIntegrationModel,
 )
+from api_gateway.app.message_queue.instance import MQAppState
 from api_gateway.app.utils import gen_unique_identifier
 
 from ...base import ItemCountResponseModel
@@ -40,6 +42,7 @@ from ...depends import (
     current_user,
     get_db,
     get_external_api,
+    get_mq,
 )
 from ...error_codes import *
 from ...error_model import ErrorModel, error_model, error_msg
@@ -70,6 +73,12 @@ def log_operation_error(operation: str, reason: str, **kwargs):
     log_operation_error_to("api.integrations", operation, reason, **kwargs)
 
 
+def invalidate_integrations_cache(mq: MQApp, project_id: str):
+    # Crash notifications must not use outdated integrations
+    mq_state: MQAppState = mq.state
+    mq_state.integrations_cache.invalidate(project_id)
+
+
 ########################################
 # Create integration
 ########################################
@@ -97,6 +106,7 @@ async def create_bug_tracker_integration(
     current_user: ORMUser = Depends(current_user),
     project_id: str = Path(..., regex=r"^\d+$"),
     db: IDatabase = Depends(get_db),
+    mq: MQApp = Depends(get_mq),
 ):
     def error_response(status_code: int, error_code: int):
         kw = {"project_id": project_id, "integration": integration.name}
@@ -138,6 +148,7 @@ async def create_bug_tracker_integration(
         last_error=None,
         enabled=True,
     )
+    invalidate_integrations_cache(mq, project_id)
 
     response_data = IntegrationResponseModel(**created_integration.dict())
     log_operation_debug_info(operation, response_data)
@@ -408,6 +419,7 @@ async def update_bug_tracker_integration(
     integration_id: str = Path(..., regex=r"^\d+$"),
     project_id: str = Path(..., regex=r"^\d+$"),
     db: IDatabase = Depends(get_db),
+    mq: MQApp = Depends(get_mq),
 ):
     def error_response(status_code: int, error_code: int):
         kw = {"project_id": project_id, "integration_id": integration_id}
@@ -429,6 +441,7 @@ async def update_bug_tracker_integration(
     new_fields = integration.dict(exclude_unset=True)
     merged = {**old_integration.dict(), **new_fields}
     await db.integrations.update(ORMIntegration(**merged))
+    invalidate_integrations_cache(mq, project_id)
 
     log_operation_success(
         operation=operation,
@@ -470,6 +483,7 @@ async def update_bug_tracker_integration_config(
     integration_id: str = Path(..., regex=r"^\d+$"),
     project_id: str = Path(..., regex=r"^\d+$"),
     db: IDatabase = Depends(get_db),
+    mq: MQApp = Depends(get_mq),
 ):
     def error_response(status_code: int, error_code: int):
         kw = {"project_id": project_id, "integration_id": integration_id}
@@ -509,6 +523,7 @@ async def update_bug_tracker_integration_config(
     integration.update_rev = update_rev
     integration.status = ORMIntegrationStatus.in_progress
     await db.integrations.update(integration)
+    invalidate_integrations_cache(mq, project_id)
 
     log_operation_success(
         operation=operation,
@@ -546,6 +561,7 @@ async def delete_integration(
     integration_id: str = Path(..., regex=r"^\d+$"),
     project_id: str = Path(..., regex=r"^\d+$"),
     db: IDatabase = Depends(get_db),
+    mq: MQApp = Depends(get_mq),
 ):
     def error_response(status_code: int, error_code: int):
         kw = {"project_id": project_id, "integration_id": integration_id}
@@ -561,6 +577,7 @@ async def delete_integration(
 
     # First, delete from db to disable notifications
     await db.integrations.delete(integration)
+    invalidate_integrations_cache(mq, project_id)
 
     # Then, delete record from jira reporter
     if integration.type == ORMIntegrationTypeID.jira:
@@ -82,6 +82,7 @@ from typing import Any, AsyncIterator, Optional, Set
 from fastapi import APIRouter, Depends, Header, Path, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
+from starlette.background import BackgroundTask
 from starlette.status import *
 
 router = APIRouter(
@@ -1052,7 +1053,11 @@ async def download_revision_binaries(
         caller=current_user.name,
     )
 
-    return StreamingResponse(chunks, media_type="application/octet-stream")
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        background=BackgroundTask(chunks.aclose),
+    )
 
 
 ########################################
@@ -1126,7 +1131,11 @@ async def download_revision_seeds(
         caller=current_user.name,
     )
 
-    return StreamingResponse(chunks, media_type="application/octet-stream")
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        background=BackgroundTask(chunks.aclose),
+    )
 
 
 ########################################
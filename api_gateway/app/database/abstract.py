@@ -154,7 +154,12 @@ class IUsers(metaclass=ABCMeta):
 
     @abstractmethod
     @testing_only
-    async def generate_test_set(self, n: int, prefix: str) -> List[ORMUser]:
+    async def generate_test_set(
+        self,
+        n: int,
+        prefix: str,
+        erasure_date: Optional[str] = None,
+    ) -> List[ORMUser]:
         pass
 
 
@@ -910,6 +915,18 @@ class IIntegrations(metaclass=ABCMeta):
     async def update(self, integration: ORMIntegration):
         pass
 
+    @abstractmethod
+    async def inc_num_undelivered(self, integration_ids: List[str]):
+        pass
+
+    @abstractmethod
+    async def report_undelivered(
+        self,
+        config_id: str,
+        last_error: str,
+    ) -> ORMIntegration:
+        pass
+
     @abstractmethod
     async def delete(self, integration: ORMIntegration):
         pass
@@ -1007,3 +1024,13 @@ class IDatabase(metaclass=ABCMeta):
     @testing_only
     async def truncate_all_collections(self) -> None:
         pass
+
+    @abstractmethod
+    @testing_only
+    async def dump_all_collections(self) -> Dict[str, List[dict]]:
+        pass
+
+    @abstractmethod
+    @testing_only
+    async def restore_all_collections(self, dump: Dict[str, List[dict]]) -> None:
+        pass
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from aioarangodb.client import ArangoClient
 from aioarangodb.database import StandardDatabase
@@ -223,13 +223,49 @@ class ArangoDB(IDatabase):
         await _self._init(settings)
         return _self
 
+    def _own_collections(self) -> List[str]:
+
+        """Names of collections used by this app. Other apps
+        (or parallel test runs) may keep theirs in the same database"""
+
+        names = []
+        for _, value in self._collections:
+            if isinstance(value, str):
+                names.append(value)
+            else:
+                names.extend(name for _, name in value)
+
+        return names
+
     @testing_only
     async def truncate_all_collections(self):
         self._logger.warning("Clearing all collections...")
         async with self._db.begin_batch_execution(return_result=False) as db:
-            for col_name in [col["name"] for col in await self._db.collections()]:
+            for col_name in self._own_collections():
                 await db.collection(col_name).truncate()
 
+    @testing_only
+    async def dump_all_collections(self):
+        dump = {}
+        query = "FOR doc IN @@collection RETURN doc"
+        for col_name in self._own_collections():
+            variables = {"@collection": col_name}
+            cursor = await self._db.aql.execute(query, bind_vars=variables)
+            dump[col_name] = [doc async for doc in cursor]
+
+        return dump
+
+    @testing_only
+    async def restore_all_collections(self, dump):
+        # Whole restore is sent in one batch request.
+        # Import with overwrite replaces all documents in collection
+        async with self._db.begin_batch_execution(return_result=False) as db:
+            for col_name, docs in dump.items():
+                if docs:
+                    await db.collection(col_name).import_bulk(docs, overwrite=True)
+                else:
+                    await db.collection(col_name).truncate()
+
     async def close(self):
 
         assert not self._is_closed, "Database connection has been already closed"
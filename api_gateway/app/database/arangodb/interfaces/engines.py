@@ -201,7 +201,7 @@ class DBEngines(DBBase, IEngines):
         if cursor.empty():
             raise DBLangNotFoundError()
 
-        engine.langs.append(lang_id)
+        engine.langs = (*engine.langs, lang_id)
 
     @maybe_unknown_error
     @maybe_not_found(DBEngineNotFoundError)  # current engine deleted
@@ -220,7 +220,7 @@ class DBEngines(DBBase, IEngines):
             }
         )
 
-        engine.langs = new_langs
+        engine.langs = tuple(new_langs)
 
     @maybe_unknown_error
     @maybe_not_found(DBEngineNotFoundError)  # current engine deleted
@@ -237,4 +237,4 @@ class DBEngines(DBBase, IEngines):
             }
         )
 
-        engine.langs = lang_ids
+        engine.langs = tuple(lang_ids)
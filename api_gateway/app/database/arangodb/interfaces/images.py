@@ -301,7 +301,7 @@ class DBImages(DBBase, IImages):
             }
         )
 
-        image.engines = new_engines
+        image.engines = tuple(new_engines)
 
     @maybe_unknown_error
     async def set_engines(self, image: ORMImage, engine_ids: List[ORMEngineID]):
@@ -316,7 +316,7 @@ class DBImages(DBBase, IImages):
             }
         )
 
-        image.engines = engine_ids
+        image.engines = tuple(engine_ids)
 
     @testing_only
     @maybe_unknown_error
@@ -244,6 +244,57 @@ class DBIntegrations(DBBase, IIntegrations):
             id_to_dbkey(integration.dict()), silent=True
         )
 
+    @maybe_unknown_error
+    async def inc_num_undelivered(self, integration_ids: List[str]):
+
+        # fmt: off
+        query, variables = """
+            FOR integration IN @@collection
+                FILTER integration._key IN @integration_ids
+                UPDATE integration WITH {
+                    num_undelivered: integration.num_undelivered + 1
+                } IN @@collection
+        """, {
+            "@collection": self._collections.integrations,
+            "integration_ids": integration_ids,
+        }
+        # fmt: on
+
+        await self._db.aql.execute(query, bind_vars=variables)
+
+    @maybe_unknown_error
+    async def report_undelivered(
+        self,
+        config_id: str,
+        last_error: str,
+    ) -> ORMIntegration:
+
+        # fmt: off
+        query, variables = """
+            FOR integration IN @@collection
+                FILTER integration.config_id == @config_id
+                LIMIT 1
+                UPDATE integration WITH {
+                    num_undelivered: integration.num_undelivered + 1,
+                    last_error: @last_error,
+                } IN @@collection
+                RETURN MERGE(NEW, {
+                    "id": NEW._key,
+                })
+        """, {
+            "@collection": self._collections.integrations,
+            "config_id": config_id,
+            "last_error": last_error,
+        }
+        # fmt: on
+
+        cursor: Cursor = await self._db.aql.execute(query, bind_vars=variables)
+
+        if cursor.empty():
+            raise DBIntegrationNotFoundError()
+
+        return ORMIntegration(**cursor.pop())
+
     @maybe_unknown_error
     async def delete(self, integration: ORMIntegration):
         await self._col_integrations.delete(
@@ -259,7 +259,12 @@ class DBUsers(DBBase, IUsers):
 
     @testing_only
     @maybe_unknown_error
-    async def generate_test_set(self, n: int, prefix: str) -> List[ORMUser]:
+    async def generate_test_set(
+        self,
+        n: int,
+        prefix: str,
+        erasure_date: Optional[str] = None,
+    ) -> List[ORMUser]:
 
         # Password for every user (="user")
         password = "argon2id$v=19$m=102400,t=2,p=8$OxoDTuWRrgHo6nLX0Fvk6g$jw6IHL7pEjVkqoHugxoGmg"  # cspell:disable-line
@@ -276,6 +281,7 @@ class DBUsers(DBBase, IUsers):
                     is_disabled: false,
                     is_admin: false,
                     is_system: false,
+                    erasure_date: @erasure_date,
                 } INTO @@collection
 
                 RETURN MERGE(NEW, {
@@ -286,6 +292,7 @@ class DBUsers(DBBase, IUsers):
             "password": password,
             "count": n,
             "prefix": prefix,
+            "erasure_date": erasure_date,
         }
         # fmt: on
 
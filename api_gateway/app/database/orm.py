@@ -1,24 +1,34 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from pydantic import BaseModel, Field
 
 
-class ORMCookie(BaseModel):
+class ORMBaseModel(BaseModel):
+
+    """Base class for all ORM models"""
+
+    class Config:
+        # Nested models (e.g. revision of fuzzer) loaded from
+        # database are not shared, so it's safe not to copy them
+        copy_on_model_validation = False
+
+
+class ORMCookie(ORMBaseModel):
     id: str
     expires: Optional[str] = None
     user_id: str
     metadata: str
 
 
-class ORMDeviceCookie(BaseModel):
+class ORMDeviceCookie(ORMBaseModel):
     username: str
     nonce: str
 
 
-class ORMUser(BaseModel):
+class ORMUser(ORMBaseModel):
     id: str
     name: str
     display_name: str
@@ -32,7 +42,7 @@ class ORMUser(BaseModel):
     no_backup: bool = Field(False)
 
 
-class ORMUserLockout(BaseModel):
+class ORMUserLockout(ORMBaseModel):
 
     id: str
     """ Use pair <user_id, NONCE> as unique key """
@@ -97,33 +107,33 @@ class ORMLangID(str, Enum):
     # javascript = "javascript" # libfuzzer
 
 
-class ORMLang(BaseModel):
+class ORMLang(ORMBaseModel):
     id: ORMLangID
     display_name: str
 
 
-class ORMEngine(BaseModel):
+class ORMEngine(ORMBaseModel):
     id: ORMEngineID
     display_name: str
-    langs: List[ORMLangID]
+    langs: Tuple[ORMLangID, ...]
 
 
-class ORMImage(BaseModel):
+class ORMImage(ORMBaseModel):
     id: str
     name: str
     description: str
-    engines: List[ORMEngineID]
+    engines: Tuple[ORMEngineID, ...]
     status: ORMImageStatus
     project_id: Optional[str] = None
 
 
-class ORMIntegrationType(BaseModel):
+class ORMIntegrationType(ORMBaseModel):
     id: ORMIntegrationTypeID
     display_name: str
     twoway: bool
 
 
-class ORMProject(BaseModel):
+class ORMProject(ORMBaseModel):
     id: str
     name: str
     description: str
@@ -135,7 +145,7 @@ class ORMProject(BaseModel):
     no_backup: bool = Field(False)
 
 
-class ORMFuzzer(BaseModel):
+class ORMFuzzer(ORMBaseModel):
     id: str
     name: str
     description: str
@@ -150,23 +160,23 @@ class ORMFuzzer(BaseModel):
     no_backup: bool = Field(False)
 
 
-class ORMEvent(BaseModel):
+class ORMEvent(ORMBaseModel):
     code: str
     message: str
     details: Optional[str]
 
 
-class ORMError(BaseModel):
+class ORMError(ORMBaseModel):
     code: str
     message: str
 
 
-class ORMFeedback(BaseModel):
+class ORMFeedback(ORMBaseModel):
     scheduler: ORMEvent
     agent: Optional[ORMEvent] = None
 
 
-class ORMUploadStatus(BaseModel):
+class ORMUploadStatus(ORMBaseModel):
     uploaded: bool
     last_error: Optional[ORMError] = None
 
@@ -184,7 +194,7 @@ class ORMHealth(str, Enum):
     ok = "Ok"
 
 
-class ORMRevision(BaseModel):
+class ORMRevision(ORMBaseModel):
     id: str
     name: str
     description: str
@@ -214,7 +224,7 @@ class ORMStatisticsGroupBy(str, Enum):
     month = "month"
 
 
-class ORMBaseStatistics(BaseModel):
+class ORMBaseStatistics(ORMBaseModel):
 
     id: Optional[str] = None
 
@@ -228,7 +238,7 @@ class ORMBaseStatistics(BaseModel):
     """ Date when statistics was retrieved """
 
 
-class ORMStatisticsCrashesExact(BaseModel):
+class ORMStatisticsCrashesExact(ORMBaseModel):
     total: int
     unique: int
 
@@ -246,7 +256,7 @@ class ORMBaseFuzzerStatistics(ORMBaseStatistics):
     """ Fuzzer working time """
 
 
-class ORMStatisticsLibFuzzerExact(BaseModel):
+class ORMStatisticsLibFuzzerExact(ORMBaseModel):
 
     execs_per_sec: int
     """ Average count of executions per second """
@@ -277,7 +287,7 @@ class ORMStatisticsLibFuzzer(
     pass
 
 
-class ORMStatisticsAFLExact(BaseModel):
+class ORMStatisticsAFLExact(ORMBaseModel):
 
     cycles_done: int
     """queue cycles completed so far"""
@@ -323,7 +333,7 @@ class ORMStatisticsAFL(
     pass
 
 
-class ORMBaseGroupedStatistics(BaseModel):
+class ORMBaseGroupedStatistics(ORMBaseModel):
 
     date: str
     """ Date period """
@@ -352,7 +362,7 @@ class ORMGroupedStatisticsAFL(
     pass
 
 
-class ORMCrash(BaseModel):
+class ORMCrash(ORMBaseModel):
 
     id: str
     """ Autogenerated unique database key """
@@ -413,7 +423,7 @@ class ORMIntegrationTypeID(str, Enum):
     # mail = "mail"
 
 
-class ORMIntegration(BaseModel):
+class ORMIntegration(ORMBaseModel):
 
     id: str
     """ Autogenerated unique database key """
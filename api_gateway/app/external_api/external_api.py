@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, List
 
-from aiohttp import ClientSession
+from aiohttp import TCPConnector
 
 from api_gateway.app.external_api.interfaces.base import ExternalAPIBase
 
@@ -22,7 +22,7 @@ class ExternalAPI:
     _yt_reporter: YoutrackReporterAPI
 
     _logger: logging.Logger
-    _session: ClientSession
+    _connector: TCPConnector
     _is_closed: bool
 
     @property
@@ -40,9 +40,23 @@ class ExternalAPI:
     async def _init(self, settings: AppSettings):
         self._is_closed = True
         self._logger = logging.getLogger("api.external")
-        self._pool_mgr = PoolManagerAPI(settings)
-        self._jira_reporter = JiraReporterAPI(settings)
-        self._yt_reporter = YoutrackReporterAPI(settings)
+
+        # One connection pool and DNS cache for all external APIs.
+        # Idle connections are dropped before upstream servers do it
+        # (uvicorn closes them after 5s), so requests are never sent
+        # over a connection which is being closed by the other side.
+        # For the same reason connections are not opened in advance:
+        # they would be closed before the first API call
+        self._connector = TCPConnector(
+            limit=200,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=4,
+        )
+
+        self._pool_mgr = PoolManagerAPI(settings, self._connector)
+        self._jira_reporter = JiraReporterAPI(settings, self._connector)
+        self._yt_reporter = YoutrackReporterAPI(settings, self._connector)
         self._is_closed = False
 
     @staticmethod
@@ -64,6 +78,7 @@ class ExternalAPI:
         for session in sessions:
             await session.close()
 
+        await self._connector.close()
         self._is_closed = True
 
     def __del__(self):
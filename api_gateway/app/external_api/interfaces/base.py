@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from logging import Logger, getLogger
-from typing import Any, Callable, Optional, Type, TypeVar
+import asyncio
+from logging import DEBUG, Logger, getLogger
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
-from aiohttp import ClientError, ClientResponse, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession, TCPConnector
 from pydantic import BaseModel, ValidationError
 
 from api_gateway.app.api.error_model import ErrorModel
@@ -18,6 +19,28 @@ from api_gateway.app.utils import json_dumps, json_loads
 
 ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
 
+_PLAIN_TYPES = (str, int, float, bool)
+_plain_models: Dict[Type[BaseModel], bool] = {}
+
+
+def _is_plain_model(model: Type[BaseModel]) -> bool:
+
+    """Checks that model has no nested models,
+    enums or containers, so it's safe to construct
+    it from trusted data without validation"""
+
+    try:
+        return _plain_models[model]
+    except KeyError:
+        pass
+
+    is_plain = all(
+        field.outer_type_ in _PLAIN_TYPES for field in model.__fields__.values()
+    )
+
+    _plain_models[model] = is_plain
+    return is_plain
+
 
 class ExternalAPIBase:
 
@@ -25,12 +48,23 @@ class ExternalAPIBase:
 
     _session: ClientSession
     _logger: Logger
+    _trusted: bool
 
-    def __init__(self, endpoint_url: str):
+    def __init__(
+        self,
+        endpoint_url: str,
+        connector: Optional[TCPConnector] = None,
+        trusted: bool = False,
+    ):
+        # Connector is shared between all external APIs
+        # and is closed by its owner, not by this session
         self._logger = getLogger("api.external")
+        self._trusted = trusted
         self._session = ClientSession(
             json_serialize=json_dumps,
             base_url=endpoint_url,
+            connector=connector,
+            connector_owner=connector is None,
         )
 
     async def close(self):
@@ -41,6 +75,10 @@ class ExternalAPIBase:
         response: ClientResponse,
         details: str,
     ):
+        # Do not read response body, if it won't be logged
+        if not self._logger.isEnabledFor(DEBUG):
+            return
+
         msg = "API call failed. Status code: %d. Response body:\n%s"
         self._logger.debug(msg, response.status, await response.text())
         self._logger.debug("Error details: %s", details)
@@ -72,8 +110,8 @@ class ExternalAPIBase:
 
         raise EAPIServerError(status_code, error.code, error.message)
 
-    @staticmethod
     def _parse_obj(
+        self,
         json_data: Any,
         response_model: Type[ResponseModel],
     ) -> ResponseModel:
@@ -81,8 +119,15 @@ class ExternalAPIBase:
         if not isinstance(json_data, dict):
             raise EAPIResponseParseError()
 
+        # Internal services have already validated their output.
+        # Models with nested fields are still validated to be built
+        if self._trusted and _is_plain_model(response_model):
+            return response_model.construct(**json_data)
+
+        # Already checked for dict, so call model directly
+        # instead of going through parse_obj dispatching
         try:
-            data = response_model.parse_obj(json_data)
+            data = response_model(**json_data)
 
         except (KeyError, ValidationError) as e:
             raise EAPIResponseParseError() from e
@@ -92,13 +137,29 @@ class ExternalAPIBase:
     @staticmethod
     async def _parse_json(response: ClientResponse):
 
+        # Parse raw bytes to avoid decoding body to str first
         try:
-            result = await response.json(loads=json_loads)
+            result = json_loads(await response.read())
         except ValueError as e:
             raise EAPIResponseParseError() from e
 
         return result
 
+    async def _consume(
+        self,
+        response: ClientResponse,
+        status_allowed_fn: Callable,
+    ):
+
+        """Parses response body once. Returns
+        json data or raises error sent by server"""
+
+        json_data = await self._parse_json(response)
+        if not status_allowed_fn(response):
+            self._parse_error_and_raise(response.status, json_data)
+
+        return json_data
+
     async def parse_response(
         self,
         response: ClientResponse,
@@ -110,13 +171,7 @@ class ExternalAPIBase:
             status_allowed_fn = self._default_status_allowed
 
         try:
-            json_data = await self._parse_json(response)
-            if not status_allowed_fn(response):
-                self._parse_error_and_raise(
-                    response.status,
-                    json_data,
-                )
-
+            json_data = await self._consume(response, status_allowed_fn)
             result = self._parse_obj(
                 json_data,
                 response_model,
@@ -133,12 +188,40 @@ class ExternalAPIBase:
         response: ClientResponse,
         status_allowed_fn: Optional[Callable] = None,
     ):
-        await self.parse_response(
-            response,
-            BaseModel,
-            status_allowed_fn,
-            False,
-        )
+        if status_allowed_fn is None:
+            status_allowed_fn = self._default_status_allowed
+
+        # No body is expected on success -> do not parse it.
+        # Read it anyway: unread body makes aiohttp close
+        # connection instead of returning it to the pool
+        if status_allowed_fn(response):
+            await response.read()
+            return
+
+        try:
+            json_data = await self._parse_json(response)
+            self._parse_error_and_raise(response.status, json_data)
+
+        except ExternalAPIError as e:
+            await self.log_api_error(response, str(e))
+            raise
+
+    async def _fetch_page(
+        self,
+        url: str,
+        status_allowed_fn: Callable,
+        **kwargs,
+    ):
+        async with self._session.get(url, **kwargs) as response:
+            try:
+                json_data = await self._consume(response, status_allowed_fn)
+                result = self._parse_list_response(json_data)
+
+            except ExternalAPIError as e:
+                await self.log_api_error(response, str(e))
+                raise
+
+        return result
 
     async def paginate(
         self,
@@ -151,44 +234,56 @@ class ExternalAPIBase:
         if status_allowed_fn is None:
             status_allowed_fn = self._default_status_allowed
 
-        if "params" not in kwargs:
-            kwargs["params"] = dict()
+        params = kwargs.pop("params", None) or dict()
+        pg_num = params.get("pg_num", 0)
+
+        def fetch_page(pg_num: int):
+            return asyncio.ensure_future(
+                self._fetch_page(
+                    url,
+                    status_allowed_fn,
+                    params={**params, "pg_num": pg_num},
+                    **kwargs,
+                )
+            )
+
+        next_page = fetch_page(pg_num)
 
         try:
-            pg_num = kwargs["params"].get("pg_num", 0)
             while True:
 
-                # Fetch next page
-                kwargs["params"].update({"pg_num": pg_num})
-                async with self._session.get(url, **kwargs) as response:
+                # Wait for page fetched in advance
+                result = await next_page
+                pg_size = result.pg_size
+                items = result.items
 
-                    # Ensure no errors occurred
-                    json_data = await self._parse_json(response)
-                    if not status_allowed_fn(response):
-                        self._parse_error_and_raise(json_data)
+                # No items in page -> exit
+                if not items:
+                    break
 
-                    # Parse response
-                    result = self._parse_list_response(json_data)
-                    pg_size = result.pg_size
-                    items = result.items
+                # Page not full -> next page will be empty
+                if len(items) < pg_size:
+                    next_page = None
 
-                    # No items in page -> exit
-                    if not items:
-                        break
-
-                    # Yield parsed item
-                    for item in items:
-                        yield self._parse_obj(item, response_model)
+                # Read ahead next page while items are consumed
+                else:
+                    pg_num += 1
+                    next_page = fetch_page(pg_num)
 
-                    # Page not full -> next page will be empty
-                    if len(items) < pg_size:
-                        break
+                # Yield parsed item
+                for item in items:
+                    yield self._parse_obj(item, response_model)
 
-                    pg_num += 1
+                if next_page is None:
+                    break
 
         except ClientError as e:
             raise EAPIClientError(e) from e
 
-        except ExternalAPIError as e:
-            await self.log_api_error(response, str(e))
-            raise
+        finally:
+            # Consumer stopped iteration or error occurred
+            if next_page is not None:
+                if not next_page.done():
+                    next_page.cancel()
+                elif not next_page.cancelled():
+                    next_page.exception()
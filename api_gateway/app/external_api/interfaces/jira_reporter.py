@@ -1,3 +1,6 @@
+from typing import Optional
+
+from aiohttp import TCPConnector
 from pydantic import BaseModel
 
 from api_gateway.app.external_api.models import JiraIntegrationModel
@@ -7,6 +10,9 @@ from api_gateway.app.utils import PrefixedLogger
 from ..utils import wrap_aiohttp_errors
 from .base import ExternalAPIBase
 
+# Fields sent to reporter on create/update
+_BODY_FIELDS = tuple(f for f in JiraIntegrationModel.__fields__ if f != "id")
+
 
 class CreateIntegrationResponseModel(BaseModel):
     id: str
@@ -20,15 +26,23 @@ class JiraReporterAPI(ExternalAPIBase):
 
     """Communication with Jira reporter"""
 
-    def __init__(self, settings: AppSettings):
-        super().__init__(settings.api.endpoints.jira_reporter)
+    def __init__(
+        self,
+        settings: AppSettings,
+        connector: Optional[TCPConnector] = None,
+    ):
+        super().__init__(
+            settings.api.endpoints.jira_reporter,
+            connector,
+            settings.api.trust_internal,
+        )
         extra = {"prefix": f"[{self.__class__.__name__}]"}
         self._logger = PrefixedLogger(self._logger, extra)
         self._base_path = "/api/v1/integrations"
 
     @wrap_aiohttp_errors
     async def create_integration(self, integration: JiraIntegrationModel):
-        json_data = integration.dict(exclude={"id"})
+        json_data = {f: getattr(integration, f) for f in _BODY_FIELDS}
         response = await self._session.post(self._base_path, json=json_data)
         data = await self.parse_response(response, CreateIntegrationResponseModel)
         return data.id
@@ -36,7 +50,7 @@ class JiraReporterAPI(ExternalAPIBase):
     @wrap_aiohttp_errors
     async def update_integration(self, integration: JiraIntegrationModel):
         url = f"{self._base_path}/{integration.id}"
-        json_data = integration.dict(exclude={"id"})
+        json_data = {f: getattr(integration, f) for f in _BODY_FIELDS}
         response = await self._session.put(url, json=json_data)
         await self.parse_response_no_model(response)
 
@@ -1,5 +1,7 @@
 from typing import List, Optional, Union
 
+from aiohttp import TCPConnector
+
 from api_gateway.app.api.base import ItemCountResponseModel
 from api_gateway.app.api.models.pools import (
     AdminUpdatePoolInfoRequestModel,
@@ -19,8 +21,16 @@ class PoolManagerAPI(ExternalAPIBase):
 
     """Communication with Pool manager"""
 
-    def __init__(self, settings: AppSettings):
-        super().__init__(settings.api.endpoints.pool_manager)
+    def __init__(
+        self,
+        settings: AppSettings,
+        connector: Optional[TCPConnector] = None,
+    ):
+        super().__init__(
+            settings.api.endpoints.pool_manager,
+            connector,
+            settings.api.trust_internal,
+        )
         extra = {"prefix": f"[{self.__class__.__name__}]"}
         self._logger = PrefixedLogger(self._logger, extra)
         self._base_path = "/api/v1/pools"
@@ -42,9 +52,7 @@ class PoolManagerAPI(ExternalAPIBase):
         id: str,
         user_id: Optional[str] = None,
     ):
-        params = dict()
-        if user_id is not None:
-            params["user_id"] = user_id
+        params = {"user_id": user_id} if user_id is not None else None
 
         url = f"{self._base_path}/{id}"
         response = await self._session.get(url, params=params)
@@ -73,9 +81,7 @@ class PoolManagerAPI(ExternalAPIBase):
         body: AdminUpdatePoolInfoRequestModel,
         user_id: Optional[str] = None,
     ):
-        params = dict()
-        if user_id is not None:
-            params["user_id"] = user_id
+        params = {"user_id": user_id} if user_id is not None else None
 
         response = await self._session.patch(
             url=f"{self._base_path}/{id}",
@@ -91,9 +97,7 @@ class PoolManagerAPI(ExternalAPIBase):
         node_group: Union[LocalNodeGroupModel, CloudNodeGroupModel],
         user_id: Optional[str] = None,
     ):
-        params = dict()
-        if user_id is not None:
-            params["user_id"] = user_id
+        params = {"user_id": user_id} if user_id is not None else None
 
         response = await self._session.put(
             url=f"{self._base_path}/{id}/node_group",
@@ -108,9 +112,7 @@ class PoolManagerAPI(ExternalAPIBase):
         id: str,
         user_id: Optional[str] = None,
     ):
-        params = dict()
-        if user_id is not None:
-            params["user_id"] = user_id
+        params = {"user_id": user_id} if user_id is not None else None
 
         response = await self._session.delete(f"{self._base_path}/{id}", params=params)
         await self.parse_response_no_model(response)
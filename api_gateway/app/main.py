@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from contextlib import suppress
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import HTMLResponse
 from fastapi.routing import APIRoute
@@ -24,15 +23,20 @@ from api_gateway.app.middlewares import register_middlewares
 try:
     import orjson  # type: ignore
 except ModuleNotFoundError:
+    orjson = None
     from fastapi.responses import JSONResponse
 else:
     from fastapi.responses import ORJSONResponse as JSONResponse
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import sys
 
 from starlette.status import (
+    HTTP_304_NOT_MODIFIED,
     HTTP_422_UNPROCESSABLE_ENTITY,
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
@@ -65,56 +69,67 @@ import fastapi.openapi.utils as fu
 fu.validation_error_response_definition = ErrorModel.schema()
 
 
+@functools.lru_cache(maxsize=None)
+def encoded_error_model(error_code: str) -> bytes:
+    return JSONResponse(error_model(error_code).dict()).body
+
+
 def configure_exception_handlers(app: FastAPI):
+
+    s3_logger = logging.getLogger("s3")
+    db_logger = logging.getLogger("db")
+    mq_logger = logging.getLogger("mq")
+    eapi_logger = logging.getLogger("api.external")
+    main_logger = logging.getLogger("main")
+    depends_logger = logging.getLogger("depends")
+
+    # Body of internal error response never changes
+    internal_error = JSONResponse(error_body(E_INTERNAL_ERROR)).body
+
     def error_response(request: Request):
-        content = error_body(E_INTERNAL_ERROR)
-        return JSONResponse(content, HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response(
+            content=internal_error,
+            status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type="application/json",
+        )
 
     @app.exception_handler(ObjectStorageError)
     async def exception_handler(request: Request, e: ObjectStorageError):
-        operation = "None"
-        with suppress(AttributeError):
-            operation = request.state.operation
+        operation = getattr(request.state, "operation", "None")
         route = f"{request.method} {request.url.path}"
         msg = "Unexpected S3 error: %s. Operation: '%s'. Route: '%s'"
-        logging.getLogger("s3").error(msg, e, operation, route)
+        s3_logger.error(msg, e, operation, route)
         return error_response(request)
 
     @app.exception_handler(DatabaseError)
     async def exception_handler(request: Request, e: DatabaseError):
-        operation = "None"
-        with suppress(AttributeError):
-            operation = request.state.operation
+        operation = getattr(request.state, "operation", "None")
         route = f"{request.method} {request.url.path}"
         msg = "Unexpected DB error: %s. Operation: '%s'. Route: '%s'"
-        logging.getLogger("db").error(msg, e, operation, route)
+        db_logger.error(msg, e, operation, route)
         return error_response(request)
 
     @app.exception_handler(MQTransportError)
     async def exception_handler(request: Request, e: MQTransportError):
-        operation = "None"
-        with suppress(AttributeError):
-            operation = request.state.operation
+        operation = getattr(request.state, "operation", "None")
         route = f"{request.method} {request.url.path}"
         msg = "Unexpected MQ error: %s. Operation: '%s'. Route: '%s'"
-        logging.getLogger("mq").error(msg, e, operation, route)
+        mq_logger.error(msg, e, operation, route)
         return error_response(request)
 
     @app.exception_handler(ExternalAPIError)
     async def exception_handler(request: Request, e: ExternalAPIError):
-        operation = "None"
-        with suppress(AttributeError):
-            operation = request.state.operation
+        operation = getattr(request.state, "operation", "None")
         route = f"{request.method} {request.url.path}"
         msg = "Unexpected external API error: %s. Operation: '%s'. Route: '%s'"
-        logging.getLogger("api.external").error(msg, e, operation, route)
+        eapi_logger.error(msg, e, operation, route)
         return error_response(request)
 
     @app.exception_handler(HTTPException)
     async def exception_handler(request: Request, e: HTTPException):
         route = f"{request.method} {request.url.path}"
         msg = "Unhandled HTTPException. Route: '%s'"
-        logging.getLogger("main").exception(msg, route, exc_info=e)
+        main_logger.exception(msg, route, exc_info=e)
         return error_response(request)
 
     @app.exception_handler(RequestValidationError)
@@ -124,6 +139,8 @@ def configure_exception_handlers(app: FastAPI):
         for err in e.errors():
             params.append(".".join(err["loc"]) + ": " + err["msg"])
 
+        # Params differ for every request, so body can not be cached
+        # like in encoded_error_model. Build it with the same helper
         return JSONResponse(
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
             content=error_model(E_WRONG_REQUEST, params).dict(),
@@ -132,17 +149,16 @@ def configure_exception_handlers(app: FastAPI):
     @app.exception_handler(DependencyException)
     async def exception_handler(request: Request, e: DependencyException):
 
-        operation = "None"
-        with suppress(AttributeError):
-            operation = request.state.operation
+        operation = getattr(request.state, "operation", "None")
 
         route = f"{request.method} {request.url.path}"
         msg = "API error: %s. Operation: '%s'. Route: '%s'"
-        logging.getLogger("depends").debug(msg, e, operation, route)
+        depends_logger.debug(msg, e, operation, route)
 
-        return JSONResponse(
+        return Response(
+            content=encoded_error_model(e.error_code),
             status_code=e.response_code,
-            content=error_model(e.error_code).dict(),
+            media_type="application/json",
         )
 
 
@@ -162,24 +178,30 @@ def configure_startup_events(app: FastAPI, settings: AppSettings):
         app.state.device_cookie_manager = DeviceCookieManager(settings)
         logger.info("Configuring device cookie manager... OK")
 
-    @app.on_event("startup")
     async def init_external_api():
         logger.info("Configuring external API sessions...")
         app.state.external_api = await ExternalAPI.create(settings)
         logger.info("Configuring external API sessions... OK")
 
-    @app.on_event("startup")
     async def init_object_storage():
         logger.info("Configuring object storage...")
         app.state.s3 = await ObjectStorage.create(settings)
         logger.info("Configuring object storage... OK")
 
-    @app.on_event("startup")
     async def init_database():
         logger.info("Configuring database...")
         app.state.db = await db_init(settings)
         logger.info("Configuring database... OK")
 
+    @app.on_event("startup")
+    async def init_remote_services():
+        # Independent of each other, so configured concurrently
+        await asyncio.gather(
+            init_external_api(),
+            init_object_storage(),
+            init_database(),
+        )
+
     @app.on_event("startup")
     async def init_message_queue():
         logger.info("Configuring message queue...")
@@ -188,6 +210,20 @@ def configure_startup_events(app: FastAPI, settings: AppSettings):
         mq_app.state.db = app.state.db
         mq_app.state.settings = settings
         mq_app.state.fastapi = app
+
+        # Crash url pattern depends only on path params,
+        # so resolve route once instead of doing it per message
+        crash_path = app.url_path_for(
+            "get_fuzzer_crash",
+            user_id="{user_id}",
+            project_id="{project_id}",
+            fuzzer_id="{fuzzer_id}",
+            crash_id="{crash_id}",
+        )
+
+        self_url = settings.api.endpoints.public
+        mq_app.state.crash_url_fmt = self_url + crash_path
+
         app.state.mq = mq_app
         logger.info("Configuring message queue... OK")
 
@@ -222,18 +258,23 @@ def configure_shutdown_events(app: FastAPI, settings: AppSettings):
         await app.state.bg_task_mgr.stop_tasks()
         logger.info("Stopping background tasks... OK")
 
-    @app.on_event("shutdown")
     async def exit_external_api():
         logger.info("Closing external API sessions...")
         await app.state.external_api.close()
         logger.info("Closing external API sessions... OK")
 
-    @app.on_event("shutdown")
     async def exit_object_storage():
         logger.info("Closing object storage...")
         await app.state.s3.close()
         logger.info("Closing object storage... OK")
 
+    @app.on_event("shutdown")
+    async def exit_remote_services():
+        await asyncio.gather(
+            exit_external_api(),
+            exit_object_storage(),
+        )
+
     @app.on_event("shutdown")
     async def exit_message_queue():
         logger.info("Closing message queue...")
@@ -267,9 +308,19 @@ def add_static_file(
     with open(filepath, "rb") as f:
         content = f.read()
 
+    # Let clients revalidate cached file instead of downloading it again
+    etag = '"%s"' % hashlib.md5(content).hexdigest()
+    headers = {"etag": etag, "cache-control": "no-cache"}
+
+    # Responses are built once and shared between requests
+    response = Response(content, media_type=media_type, headers=headers)
+    not_modified = Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
     @app.get(url, include_in_schema=False)
-    async def static_file_handler():
-        return HTMLResponse(content=content, media_type=media_type)
+    async def static_file_handler(request: Request):
+        if request.headers.get("if-none-match") == etag:
+            return not_modified
+        return response
 
 
 def configure_routes(app: FastAPI):
@@ -295,6 +346,43 @@ def configure_routes(app: FastAPI):
     logger.info("Configuring routes... OK")
 
 
+def configure_openapi(app: FastAPI):
+
+    """Encodes openapi.json once per root path and serves it
+    as bytes. Must be called after all the routes are configured"""
+
+    if app.openapi_url is None:
+        return
+
+    # Replace default handler, which encodes schema on every request
+    app.router.routes = [
+        route
+        for route in app.router.routes
+        if getattr(route, "path", None) != app.openapi_url
+    ]
+
+    specs: Dict[str, bytes] = {"": JSONResponse(app.openapi()).body}
+    app.state.openapi_bytes = specs
+
+    @app.get(app.openapi_url, include_in_schema=False)
+    async def openapi(request: Request):
+
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        spec = specs.get(root_path)
+
+        if spec is None:
+            # Same as default handler, but schema itself is not modified
+            schema = app.openapi()
+            if root_path and app.root_path_in_servers:
+                servers = [{"url": root_path}, *schema.get("servers", [])]
+                schema = {**schema, "servers": servers}
+
+            spec = JSONResponse(schema).body
+            specs[root_path] = spec
+
+        return Response(spec, media_type="application/json")
+
+
 def configure_static_files(app: FastAPI):
     app.mount("/static", StaticFiles(directory="static"), name="static")
     app.mount("/locales", StaticFiles(directory="locales"), name="locales")
@@ -308,17 +396,27 @@ def generate_api_spec():
 
     print("Generating openapi.json...")
 
-    with open("openapi.json", "w") as f:
-        json.dump(app.openapi(), f)
+    if orjson is not None:
+        with open("openapi.json", "wb") as f:
+            f.write(orjson.dumps(app.openapi()))
+    else:
+        # Encode whole spec at once: json.dump writes it chunk by chunk
+        spec = json.dumps(app.openapi(), separators=(",", ":"), ensure_ascii=False)
+        with open("openapi.json", "w", encoding="utf-8") as f:
+            f.write(spec)
 
     print("Generating openapi.json... OK")
     sys.exit(0)
 
 
 class EmptyJSONResponse(JSONResponse):
+
+    # Encoded once, returned for every empty response
+    empty_body = JSONResponse(dict()).body
+
     def render(self, content: Any) -> bytes:
         if content is None:
-            content = dict()
+            return self.empty_body
         return super().render(content)
 
 
@@ -343,10 +441,13 @@ def create_app():
     logging.info("%-16s %s", "COMMIT_DATE", settings.environment.commit_date)
     logging.info("%-16s %s", "GIT_BRANCH", settings.environment.git_branch)
 
-    with open("index.html") as f:
-        app.state.index_html = f.read()
+    # Page is the same for every route of react app,
+    # so response is built once and then sent as is
+    with open("index.html", "rb") as f:
+        app.state.index_response = HTMLResponse(f.read())
 
     configure_routes(app)
+    configure_openapi(app)
     register_middlewares(app, settings)
     configure_startup_events(app, settings)
     configure_shutdown_events(app, settings)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Awaitable, List, Optional
 
-from fastapi import FastAPI
 from mqtransport.errors import ConsumeMessageError
 from pydantic import BaseModel, validator
 
@@ -24,6 +26,18 @@ if TYPE_CHECKING:
     from .instance import MQAppState, Producers
 
 
+RFC3339_UTC_TIME = re.compile(
+    r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])"
+    r"T([01]\d|2[0-3]):[0-5]\d:[0-5]\d(\.\d+)?Z$"
+)
+
+UNIQUE_CRASH_MSG = "Got unique crash for revision '%s'"
+DUPLICATE_CRASH_MSG = "Got known crash for revision '%s'"
+UNDELIVERED_REPORT_MSG = (
+    "Unable to deliver report for integration (id='%s', name='%s', status='%s')"
+)
+
+
 class MC_UniqueCrashFound(Consumer):
 
     """
@@ -66,32 +80,36 @@ class MC_UniqueCrashFound(Consumer):
 
         @validator("created", pre=True)
         def validate_time(cls, value: str):
-            if not value.endswith("Z"):
+            if not RFC3339_UTC_TIME.match(value):
                 raise ValueError("Not a valid rfc3339 time")
 
-            # Try to parse without last 'Z'
-            datetime.fromisoformat(value[:-1])
+            # Regex does not know month lengths, e.g. '2023-02-31'
+            datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")
             return value
 
-    @staticmethod
+    _producer_names = {
+        ORMIntegrationTypeID.jira: "jr_unique_crash",
+        ORMIntegrationTypeID.youtrack: "yt_unique_crash",
+    }
+
+    @classmethod
     def _find_producer(
+        cls,
         producers: Producers,
         integration_type: ORMIntegrationTypeID,
     ) -> Producer:
 
-        if integration_type == ORMIntegrationTypeID.jira:
-            return producers.jr_unique_crash
-        elif integration_type == ORMIntegrationTypeID.youtrack:
-            return producers.yt_unique_crash
+        try:
+            name = cls._producer_names[integration_type]
+        except KeyError:
+            raise ValueError(f"Invalid integration type: '{integration_type}'")
 
-        raise ValueError(f"Invalid integration type: '{integration_type}'")
+        return getattr(producers, name)
 
     async def consume(self, msg: Model, mq_app: MQApp):
 
         state: MQAppState = mq_app.state
-        app: FastAPI = state.fastapi
         producers = state.producers
-        settings = state.settings
         db = state.db
 
         #
@@ -100,11 +118,13 @@ class MC_UniqueCrashFound(Consumer):
         #
 
         try:
-            revision = await db.revisions.get_by_id(msg.fuzzer_rev)
-            fuzzer = await db.fuzzers.get_by_id(msg.fuzzer_id)
+            revision, fuzzer = await asyncio.gather(
+                db.revisions.get_by_id(msg.fuzzer_rev),
+                db.fuzzers.get_by_id(msg.fuzzer_id),
+            )
             project = await db.projects.get_by_id(fuzzer.project_id)
             user = await db.users.get_by_id(project.owner_id)
-            integrations = await db.integrations.list_internal(project.id)
+            integrations = await state.integrations_cache.get(db, project.id)
 
         except DBRevisionNotFoundError as e:
             self.logger.error("Revision '%s' not found", msg.fuzzer_rev)
@@ -122,8 +142,7 @@ class MC_UniqueCrashFound(Consumer):
             self.logger.error("User '%s' not found", project.owner_id)
             raise ConsumeMessageError() from e
 
-        text = "Got unique crash for revision '%s'"
-        self.logger.info(text, msg.fuzzer_rev)
+        self.logger.info(UNIQUE_CRASH_MSG, msg.fuzzer_rev)
 
         #
         # Save crash info to database.
@@ -152,53 +171,63 @@ class MC_UniqueCrashFound(Consumer):
             new_unique=1,
         )
 
-        crash_path = app.url_path_for(
-            "get_fuzzer_crash",
+        crash_url = state.crash_url_fmt.format(
             user_id=user.id,
             project_id=project.id,
             fuzzer_id=msg.fuzzer_id,
             crash_id=crash.id,
         )
 
-        self_url = settings.api.endpoints.public
-        crash_url = self_url + crash_path
-
         #
         # Iterate through all attached integrations
         # Warn if integration is not ready for sending reports
         #
 
-        async for integration in integrations:
+        reports: List[Awaitable] = []
+        undelivered: List[str] = []
+        succeeded = ORMIntegrationStatus.succeeded
+
+        for integration in integrations:
 
             if not integration.enabled:
                 continue
 
-            if integration.status != ORMIntegrationStatus.succeeded:
+            if integration.status != succeeded:
 
-                self.logger.warning(
-                    "Unable to deliver report for integration"
-                    " (id='%s', name='%s', status='%s')",
-                    integration.id,
-                    integration.name,
-                    integration.status.value,
-                )
+                if self.logger.isEnabledFor(logging.WARNING):
+                    self.logger.warning(
+                        UNDELIVERED_REPORT_MSG,
+                        integration.id,
+                        integration.name,
+                        integration.status.value,
+                    )
 
-                integration.num_undelivered += 1
-                await db.integrations.update(integration)
+                undelivered.append(integration.id)
                 continue
 
-            await self._find_producer(producers, integration.type).produce(
-                crash_id=crash.id,
-                crash_info=crash.brief,
-                crash_type=crash.type,
-                crash_output=crash.output,
-                crash_url=crash_url,
-                project_name=project.name,
-                fuzzer_name=fuzzer.name,
-                revision_name=revision.name,
-                config_id=integration.config_id,
+            producer = self._find_producer(producers, integration.type)
+            reports.append(
+                producer.produce(
+                    crash_id=crash.id,
+                    crash_info=crash.brief,
+                    crash_type=crash.type,
+                    crash_output=crash.output,
+                    crash_url=crash_url,
+                    project_name=project.name,
+                    fuzzer_name=fuzzer.name,
+                    revision_name=revision.name,
+                    config_id=integration.config_id,
+                )
             )
 
+        # Count undelivered reports in one query.
+        # Done first, so failed sending does not skip it
+        if undelivered:
+            await db.integrations.inc_num_undelivered(undelivered)
+
+        # Send reports concurrently
+        await asyncio.gather(*reports)
+
 
 class MC_DuplicateCrashFound(Consumer):
 
@@ -219,18 +248,24 @@ class MC_DuplicateCrashFound(Consumer):
         input_hash: str
         """ Unique hash of crash input """
 
-    @staticmethod
+    _producer_names = {
+        ORMIntegrationTypeID.jira: "jr_duplicate_crash",
+        ORMIntegrationTypeID.youtrack: "yt_duplicate_crash",
+    }
+
+    @classmethod
     def _find_producer(
+        cls,
         producers: Producers,
         integration_type: ORMIntegrationTypeID,
     ) -> Producer:
 
-        if integration_type == ORMIntegrationTypeID.jira:
-            return producers.jr_duplicate_crash
-        elif integration_type == ORMIntegrationTypeID.youtrack:
-            return producers.yt_duplicate_crash
+        try:
+            name = cls._producer_names[integration_type]
+        except KeyError:
+            raise ValueError(f"Invalid integration type: '{integration_type}'")
 
-        raise ValueError(f"Invalid integration type: '{integration_type}'")
+        return getattr(producers, name)
 
     async def consume(self, msg: Model, app: MQApp):
 
@@ -239,26 +274,10 @@ class MC_DuplicateCrashFound(Consumer):
         db = state.db
 
         #
-        # Check revision exists and get integration settings
-        # Then update duplicate counter in database
+        # Update duplicate counter in database. Crash record
+        # is looked up by revision, so it also checks revision exists
         #
 
-        try:
-            await db.revisions.get_by_id(msg.fuzzer_rev)
-            fuzzer = await db.fuzzers.get_by_id(msg.fuzzer_id)
-            integrations = await db.integrations.list_internal(fuzzer.project_id)
-
-        except DBRevisionNotFoundError as e:
-            self.logger.error("Revision '%s' not found", msg.fuzzer_rev)
-            raise ConsumeMessageError() from e
-
-        except DBFuzzerNotFoundError as e:
-            self.logger.error("Fuzzer '%s' not found", msg.fuzzer_id)
-            raise ConsumeMessageError() from e
-
-        text = "Got known crash for revision '%s'"
-        self.logger.info(text, msg.fuzzer_rev)
-
         try:
             crash = await db.crashes.inc_duplicate_count(
                 msg.fuzzer_id, msg.fuzzer_rev, msg.input_hash
@@ -268,6 +287,8 @@ class MC_DuplicateCrashFound(Consumer):
             self.logger.error(text, msg.fuzzer_rev)
             raise ConsumeMessageError()
 
+        self.logger.info(DUPLICATE_CRASH_MSG, msg.fuzzer_rev)
+
         #
         # Send notifications, according to integration settings
         # Avoid sending messages for each duplicate found
@@ -276,32 +297,54 @@ class MC_DuplicateCrashFound(Consumer):
         if crash.duplicate_count % 10 != 0 and crash.duplicate_count != 1:
             return
 
+        try:
+            fuzzer = await db.fuzzers.get_by_id(msg.fuzzer_id)
+            integrations = await state.integrations_cache.get(db, fuzzer.project_id)
+
+        except DBFuzzerNotFoundError as e:
+            self.logger.error("Fuzzer '%s' not found", msg.fuzzer_id)
+            raise ConsumeMessageError() from e
+
         #
         # Iterate through all attached integrations
         # Warn if integration is not ready for sending reports
         #
 
-        async for integration in integrations:
+        reports: List[Awaitable] = []
+        undelivered: List[str] = []
+        succeeded = ORMIntegrationStatus.succeeded
+
+        for integration in integrations:
 
             if not integration.enabled:
                 continue
 
-            if integration.status != ORMIntegrationStatus.succeeded:
+            if integration.status != succeeded:
 
-                self.logger.warning(
-                    "Unable to deliver report for integration"
-                    " (id='%s', name='%s', status='%s')",
-                    integration.id,
-                    integration.name,
-                    integration.status.value,
-                )
+                if self.logger.isEnabledFor(logging.WARNING):
+                    self.logger.warning(
+                        UNDELIVERED_REPORT_MSG,
+                        integration.id,
+                        integration.name,
+                        integration.status.value,
+                    )
 
-                integration.num_undelivered += 1
-                await db.integrations.update(integration)
+                undelivered.append(integration.id)
                 continue
 
-            await self._find_producer(producers, integration.type).produce(
-                duplicate_count=crash.duplicate_count,
-                config_id=integration.config_id,
-                crash_id=crash.id,
+            producer = self._find_producer(producers, integration.type)
+            reports.append(
+                producer.produce(
+                    duplicate_count=crash.duplicate_count,
+                    config_id=integration.config_id,
+                    crash_id=crash.id,
+                )
             )
+
+        # Count undelivered reports in one query.
+        # Done first, so failed sending does not skip it
+        if undelivered:
+            await db.integrations.inc_num_undelivered(undelivered)
+
+        # Send reports concurrently
+        await asyncio.gather(*reports)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from mqtransport import MQApp, SQSApp
@@ -22,6 +23,7 @@ from .scheduler import (
     MP_StopFuzzersInPool,
     MP_UpdateFuzzer,
 )
+from .utils import IntegrationsCache
 from .youtrack_reporter import (
     MC_YoutrackIntegrationResult,
     MC_YoutrackReportUndelivered,
@@ -54,11 +56,14 @@ class MQAppState:
     fastapi: FastAPI
     settings: AppSettings
     producers: Producers
+    integrations_cache: IntegrationsCache
+    crash_url_fmt: str
     event_queue: Queue
     db: IDatabase
 
     def __init__(self):
         self.producers = Producers()
+        self.integrations_cache = IntegrationsCache()
 
 
 class MQAppInitializer:
@@ -110,16 +115,20 @@ class MQAppInitializer:
 
     async def _create_own_channel(self):
         queues = self._settings.message_queue.queues
-        ich = await self._app.create_consuming_channel(queues.api_gateway)
-        dlq = await self._app.create_producing_channel(queues.dlq)
+        ich, dlq = await asyncio.gather(
+            self._app.create_consuming_channel(queues.api_gateway),
+            self._app.create_producing_channel(queues.dlq),
+        )
         ich.use_dead_letter_queue(dlq)
         self._ich_api_gateway = ich
 
     async def _create_other_channels(self):
         queues = self._settings.message_queue.queues
-        och1 = await self._app.create_producing_channel(queues.scheduler)
-        och2 = await self._app.create_producing_channel(queues.jira_reporter)
-        och3 = await self._app.create_producing_channel(queues.youtrack_reporter)
+        och1, och2, och3 = await asyncio.gather(
+            self._app.create_producing_channel(queues.scheduler),
+            self._app.create_producing_channel(queues.jira_reporter),
+            self._app.create_producing_channel(queues.youtrack_reporter),
+        )
         self._och_scheduler = och1
         self._och_jira_reporter = och2
         self._och_youtrack_reporter = och3
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type
 
 from mqtransport.errors import ConsumeMessageError
 from pydantic import BaseModel, Field
@@ -100,6 +101,21 @@ class Status(BaseModel):
     message: str
     details: Optional[str]
 
+    def matches(self, event: ORMEvent) -> bool:
+        return (
+            self.code == event.code
+            and self.message == event.message
+            and self.details == event.details
+        )
+
+    def to_orm_event(self) -> ORMEvent:
+        # Fields are the same, so pass them as is without .dict()
+        return ORMEvent.construct(
+            code=self.code,
+            message=self.message,
+            details=self.details,
+        )
+
 
 class MC_FuzzerVerified(Consumer):
 
@@ -134,8 +150,9 @@ class MC_FuzzerVerified(Consumer):
         revision.status = ORMRevisionStatus.running
         await state.db.revisions.update(revision)
 
-        text = "Revision '%s' was successfully verified"
-        self.logger.info(text, msg.fuzzer_rev)
+        if self.logger.isEnabledFor(logging.INFO):
+            text = "Revision '%s' was successfully verified"
+            self.logger.info(text, msg.fuzzer_rev)
 
 
 class MC_FuzzerStopped(Consumer):
@@ -173,10 +190,11 @@ class MC_FuzzerStopped(Consumer):
             self.logger.error(text, msg.fuzzer_rev, e)
             raise ConsumeMessageError() from e
 
-        status_code = msg.fuzzer_status.code
-        status_message = msg.fuzzer_status.message
-        text = "Revision '%s' was stopped. Reason: [%d] %s"
-        self.logger.info(text, msg.fuzzer_rev, status_code, status_message)
+        if self.logger.isEnabledFor(logging.INFO):
+            status_code = msg.fuzzer_status.code
+            status_message = msg.fuzzer_status.message
+            text = "Revision '%s' was stopped. Reason: [%s] %s"
+            self.logger.info(text, msg.fuzzer_rev, status_code, status_message)
 
         #
         # Stop fuzzer and update health, status
@@ -193,8 +211,8 @@ class MC_FuzzerStopped(Consumer):
         #
 
         status = msg.agent_status
-        agent_status = ORMEvent.construct(**status.dict()) if status else None
-        fuzzer_status = ORMEvent.construct(**msg.fuzzer_status.dict())
+        agent_status = status.to_orm_event() if status else None
+        fuzzer_status = msg.fuzzer_status.to_orm_event()
 
         revision.feedback = ORMFeedback.construct(
             scheduler=fuzzer_status, agent=agent_status
@@ -235,15 +253,27 @@ class MC_FuzzerStatusChanged(Consumer):
             self.logger.error(text, msg.fuzzer_rev, e)
             raise ConsumeMessageError() from e
 
+        # Scheduler repeats the same status while fuzzer runs.
+        # Build feedback and store it only if something changed
+        feedback = revision.feedback
+        if (
+            revision.health == msg.fuzzer_health
+            and feedback is not None
+            and feedback.agent is None
+            and msg.fuzzer_status.matches(feedback.scheduler)
+        ):
+            return
+
         revision.health = msg.fuzzer_health
-        fuzzer_status = ORMEvent.construct(**msg.fuzzer_status.dict())
+        fuzzer_status = msg.fuzzer_status.to_orm_event()
         revision.feedback = ORMFeedback.construct(scheduler=fuzzer_status, agent=None)
         await state.db.revisions.update(revision)
 
-        status_code = msg.fuzzer_status.code
-        status_message = msg.fuzzer_status.message
-        text = "Status of revision '%s' was changed. Status: [%d] %s"
-        self.logger.info(text, msg.fuzzer_rev, status_code, status_message)
+        if self.logger.isEnabledFor(logging.INFO):
+            status_code = msg.fuzzer_status.code
+            status_message = msg.fuzzer_status.message
+            text = "Status of revision '%s' was changed. Status: [%s] %s"
+            self.logger.info(text, msg.fuzzer_rev, status_code, status_message)
 
         # reverse lookup to find project, user
         # notification add
@@ -346,6 +376,33 @@ class MC_FuzzerRunResult(Consumer):
         statistics: Optional[dict]
         crashes_found: int
 
+    # Statistics model, ORM model and db interface name for each engine.
+    # Built once from engine groups instead of checking them per message
+    _engine_stats: Dict[ORMEngineID, Tuple[type, type, str]] = {
+        **{
+            engine: (StatisticsLibFuzzer, ORMStatisticsLibFuzzer, "libfuzzer")
+            for engine in ORMEngineID
+            if ORMEngineID.is_libfuzzer(engine)
+        },
+        **{
+            engine: (StatisticsAFL, ORMStatisticsAFL, "afl")
+            for engine in ORMEngineID
+            if ORMEngineID.is_afl(engine)
+        },
+    }
+
+    def _pick_statistics(self, model: Type[StatisticsBase], msg: Model):
+
+        """Scheduler sends already validated statistics,
+        so only check that all the fields are present"""
+
+        try:
+            return {name: msg.statistics[name] for name in model.__fields__}
+        except KeyError as e:
+            text = "Statistics of revision '%s' has no field %s"
+            self.logger.error(text, msg.fuzzer_rev, e)
+            raise ConsumeMessageError() from e
+
     async def consume(self, msg: Model, app: MQApp):
 
         state: MQAppState = app.state
@@ -365,28 +422,19 @@ class MC_FuzzerRunResult(Consumer):
             )
 
         if msg.statistics is not None:
-            if ORMEngineID.is_libfuzzer(msg.fuzzer_engine):
-                stats = StatisticsLibFuzzer.parse_obj(msg.statistics)
-                orm_stats = ORMStatisticsLibFuzzer.construct(
-                    date=msg.finish_time,
-                    fuzzer_id=msg.fuzzer_id,
-                    revision_id=msg.fuzzer_rev,
-                    **stats.dict(),
-                )
-                await state.db.statistics.libfuzzer.create(orm_stats)
-
-            elif ORMEngineID.is_afl(msg.fuzzer_engine):
-                stats = StatisticsAFL.parse_obj(msg.statistics)
-                orm_stats = ORMStatisticsAFL.construct(
-                    date=msg.finish_time,
-                    fuzzer_id=msg.fuzzer_id,
-                    revision_id=msg.fuzzer_rev,
-                    **stats.dict(),
-                )
-                await state.db.statistics.afl.create(orm_stats)
-
-            else:
+            try:
+                model, orm_model, db_name = self._engine_stats[msg.fuzzer_engine]
+            except KeyError as e:
                 self.logger.error(f"Unknown engine id: {msg.fuzzer_engine}")
-                raise ConsumeMessageError()
+                raise ConsumeMessageError() from e
+
+            stats = self._pick_statistics(model, msg)
+            orm_stats = orm_model.construct(
+                date=msg.finish_time,
+                fuzzer_id=msg.fuzzer_id,
+                revision_id=msg.fuzzer_rev,
+                **stats,
+            )
+            await getattr(state.db.statistics, db_name).create(orm_stats)
 
         self.logger.info("Got statistics for revision '%s'", msg.fuzzer_rev)
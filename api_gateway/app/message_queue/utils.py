@@ -1,20 +1,84 @@
 from __future__ import annotations
 
+import time
+from typing import TYPE_CHECKING, Dict, Tuple
+
 from mqtransport.participants import Consumer as BaseConsumer
 from mqtransport.participants import Producer as BaseProducer
 
 from api_gateway.app.utils import PrefixedLogger
 
+if TYPE_CHECKING:
+    from api_gateway.app.database.abstract import IDatabase
+    from api_gateway.app.database.orm import ORMIntegration
+
 
 class Consumer(BaseConsumer):
+
+    _log_extra: Dict[str, str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._log_extra = {"prefix": f"[{cls.__name__}]"}
+
     def __init__(self):
         super().__init__()
-        extra = {"prefix": f"[{self.__class__.__name__}]"}
-        self._logger = PrefixedLogger(self._logger, extra)
+        self._logger = PrefixedLogger(self._logger, self._log_extra)
 
 
 class Producer(BaseProducer):
+
+    _log_extra: Dict[str, str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._log_extra = {"prefix": f"[{cls.__name__}]"}
+
     def __init__(self):
         super().__init__()
-        extra = {"prefix": f"[{self.__class__.__name__}]"}
-        self._logger = PrefixedLogger(self._logger, extra)
+        self._logger = PrefixedLogger(self._logger, self._log_extra)
+
+
+class IntegrationsCache:
+
+    """
+    Keeps integrations of projects for a short time.
+    Integrations are changed by users rarely, but crash
+    notifications, which need them, come very often
+    """
+
+    _ttl: float
+    _maxsize: int
+    _items: Dict[str, Tuple[float, Tuple[ORMIntegration, ...]]]
+
+    def __init__(self, ttl: float = 30, maxsize: int = 1024):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._items = dict()
+
+    async def get(self, db: IDatabase, project_id: str):
+
+        now = time.monotonic()
+        cached = self._items.get(project_id)
+
+        if cached is not None:
+            exp_time, integrations = cached
+            if now < exp_time:
+                return integrations
+
+        iterator = await db.integrations.list_internal(project_id)
+        integrations = tuple([integration async for integration in iterator])
+
+        # Drop the oldest record to fit into limit
+        self._items.pop(project_id, None)
+        if len(self._items) >= self._maxsize:
+            del self._items[next(iter(self._items))]
+
+        self._items[project_id] = (now + self._ttl, integrations)
+        return integrations
+
+    def invalidate(self, project_id: str):
+        self._items.pop(project_id, None)
+
+    def clear(self):
+        self._items.clear()
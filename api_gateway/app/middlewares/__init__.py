@@ -1,22 +1,22 @@
-from typing import Callable
-
 from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from api_gateway.app.settings import AppSettings
 
-from .csrf import csrf_protection_middleware
-from .react import react_middleware
-
-
-def add_middleware(app: FastAPI, func: Callable):
-    app.add_middleware(BaseHTTPMiddleware, dispatch=func)
+from .csrf import CSRFProtectionMiddleware
+from .react import ReactMiddleware
 
 
 def register_middlewares(app: FastAPI, settings: AppSettings):
-    add_middleware(app, react_middleware)
+    app.add_middleware(ReactMiddleware)
     if settings.csrf_protection.enabled:
-        add_middleware(app, csrf_protection_middleware)
+        # Routes are already registered, so resolve exempt paths once
+        app.state.csrf_exempt_paths = frozenset(
+            (
+                app.url_path_for("login"),
+                app.url_path_for("refresh_csrf_token"),
+            )
+        )
+        app.add_middleware(CSRFProtectionMiddleware)
 
 
 __all__ = ["register_middlewares"]
@@ -1,35 +1,54 @@
-from typing import Callable
+from hmac import compare_digest
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.responses import JSONResponse
+from starlette.requests import cookie_parser
 from starlette.status import *
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from ..api.depends import get_csrf_token_mgr
 from ..api.error_codes import *
 from ..api.error_model import error_body
-from ..api.handlers.security.csrf import CSRFTokenInvalid
+from ..api.handlers.security.csrf import CSRFTokenInvalid, CSRFTokenManager
 
+# Methods which change state and must be CSRF protected
+_CSRF_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
 
-async def csrf_protection_middleware(request: Request, call_next: Callable):
-    def error_response(status_code: int, error_code: str):
-        return JSONResponse(error_body(error_code), status_code)
 
-    path = request.url.path
-    app: FastAPI = request.app
-    mgr = get_csrf_token_mgr(request)
+def error_response(status_code: int, error_code: str):
+    return JSONResponse(error_body(error_code), status_code)
 
-    if request.method not in ["POST", "PUT", "PATCH", "DELETE"]:
-        return await call_next(request)
 
-    if path == app.url_path_for("login"):
-        return await call_next(request)
+def read_csrf_values(scope: Scope) -> Tuple[Optional[str], Dict[str, str]]:
 
-    if path == app.url_path_for("refresh_csrf_token"):
-        return await call_next(request)
+    """Returns CSRF token from headers and cookies,
+    found in a single pass over raw request headers"""
 
-    csrf_token1 = request.headers.get("X-CSRF-TOKEN")
-    csrf_token2 = request.cookies.get("CSRF_TOKEN")
-    user_id = request.cookies.get("USER_ID")
+    header_token = None
+    cookie_header = None
+
+    # Like starlette, take the first header of each name
+    for name, value in scope["headers"]:
+        if name == b"x-csrf-token":
+            if header_token is None:
+                header_token = value.decode("latin-1")
+        elif name == b"cookie":
+            if cookie_header is None:
+                cookie_header = value.decode("latin-1")
+
+    cookies = cookie_parser(cookie_header) if cookie_header else {}
+    return header_token, cookies
+
+
+def check_csrf_token(app: FastAPI, scope: Scope) -> Optional[JSONResponse]:
+
+    """Returns error response if request is not
+    protected with valid CSRF token, otherwise None"""
+
+    mgr: CSRFTokenManager = app.state.csrf_token_manager
+    csrf_token1, cookies = read_csrf_values(scope)
+    csrf_token2 = cookies.get("CSRF_TOKEN")
+    user_id = cookies.get("USER_ID")
 
     if user_id is None:
         return error_response(HTTP_401_UNAUTHORIZED, E_AUTHORIZATION_REQUIRED)
@@ -37,7 +56,9 @@ async def csrf_protection_middleware(request: Request, call_next: Callable):
     if csrf_token1 is None or csrf_token2 is None:
         return error_response(HTTP_403_FORBIDDEN, E_CSRF_TOKEN_MISSING)
 
-    if csrf_token1 != csrf_token2:
+    # Compare in constant time to not leak token through timings.
+    # Values are encoded, because non-ascii str are not accepted
+    if not compare_digest(csrf_token1.encode(), csrf_token2.encode()):
         return error_response(HTTP_403_FORBIDDEN, E_CSRF_TOKEN_MISMATCH)
 
     try:
@@ -48,4 +69,31 @@ async def csrf_protection_middleware(request: Request, call_next: Callable):
     if parsed_token.user_id != user_id:
         return error_response(HTTP_403_FORBIDDEN, E_CSRF_TOKEN_USER_MISMATCH)
 
-    return await call_next(request)
+    return None
+
+
+class CSRFProtectionMiddleware:
+
+    """Rejects state changing requests
+    without valid CSRF token"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+
+        if scope["type"] != "http" or scope["method"] not in _CSRF_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        app: FastAPI = scope["app"]
+        if scope["path"] in app.state.csrf_exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        response = check_csrf_token(app, scope)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
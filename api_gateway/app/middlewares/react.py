@@ -1,17 +1,33 @@
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from fastapi import Request, Response
-from fastapi.responses import HTMLResponse
 
+class ReactMiddleware:
 
-async def react_middleware(request: Request, call_next: Callable):
+    """Serves index page of react app instead of 404 responses,
+    so routes of single page application can be opened directly"""
 
-    response: Response = await call_next(request)
-    if response.status_code != 404:
-        return response
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    path = request.url.path
-    if path.startswith("/api") or path.startswith("/docs"):
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
 
-    return HTMLResponse(request.app.state.index_html)
+        # API and docs responses are sent as is
+        if scope["type"] != "http" or scope["path"].startswith(("/api", "/docs")):
+            await self.app(scope, receive, send)
+            return
+
+        not_found = False
+
+        async def send_wrapper(message: Message):
+            nonlocal not_found
+
+            # Hold back 404 response and drop its body
+            if message["type"] == "http.response.start":
+                not_found = message["status"] == 404
+            if not not_found:
+                await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if not_found:
+            await scope["app"].state.index_response(scope, receive, send)
@@ -4,6 +4,7 @@ from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from aiohttp.client_exceptions import ClientConnectionError
 from botocore.exceptions import ClientError
 
@@ -174,6 +175,9 @@ class ObjectStorageBaseInitializer:
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
+            # Single client is shared by all requests and background
+            # tasks. Default pool of 10 connections is too small for it
+            config=AioConfig(max_pool_connections=64),
         )
 
         self._s3 = resource
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from asyncio import CancelledError
 from contextlib import AsyncExitStack
@@ -5,6 +6,7 @@ from io import BytesIO
 from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 from aiobotocore.response import StreamingBody as StreamingResponse
+from boto3.s3.transfer import TransferConfig
 
 # from aiohttp import ClientError
 from botocore.exceptions import ClientError, HTTPClientError
@@ -27,19 +29,42 @@ else:
     S3Client = object
 
 
+# Objects larger than part size are copied in parts concurrently
+COPY_PART_SIZE = 64 * 1024 * 1024
+COPY_CONCURRENCY = 16
+
+# Streaming uploads read one whole part from stream at a time.
+# Only a few parts wait for upload, so memory usage is bounded
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+UPLOAD_CONFIG = TransferConfig(
+    multipart_chunksize=UPLOAD_PART_SIZE,
+    io_chunksize=UPLOAD_PART_SIZE,
+    max_concurrency=8,
+    max_io_queue=8,
+)
+
+# Body read returns data already received, up to this size.
+# So chunks follow network reads instead of being cut to small pieces
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
 class AsyncStreamingBody:
 
+    """Reads data from async iterator of chunks. Chunks are
+    collected into bytearray, which grows in place.
+    Concatenating bytes would copy all the data read so far"""
+
     _chunks: AsyncIterator[bytes]
-    _backlog: bytes
+    _backlog: bytearray
 
     def __init__(self, chunks: AsyncIterator[bytes]):
         self._chunks = chunks
-        self._backlog = b""
+        self._backlog = bytearray()
 
     async def _read_until_end(self):
 
         content = self._backlog
-        self._backlog = b""
+        self._backlog = bytearray()
 
         while True:
             try:
@@ -47,14 +72,31 @@ class AsyncStreamingBody:
             except StopAsyncIteration:
                 break
 
-        return content
+        return bytes(content)
 
     async def _read_chunk(self, size: int):
 
         content = self._backlog
-        bytes_read = len(self._backlog)
 
-        while bytes_read < size:
+        # Single chunk covers the whole read -> return it
+        # without copying into backlog and out of it again
+        if not content:
+
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+
+            if len(chunk) == size:
+                return chunk
+
+            if len(chunk) > size:
+                self._backlog = bytearray(chunk[size:])
+                return chunk[:size]
+
+            content += chunk
+
+        while len(content) < size:
 
             try:
                 chunk = await self._chunks.__anext__()
@@ -62,12 +104,15 @@ class AsyncStreamingBody:
                 break
 
             content += chunk
-            bytes_read += len(chunk)
 
-        self._backlog = content[size:]
-        content = content[:size]
+        with memoryview(content) as view:
+            result = view[:size].tobytes()
 
-        return content
+        # Remaining data is kept for the next read
+        del content[:size]
+        self._backlog = content
+
+        return result
 
     async def read(self, size: int = -1):
         if size > 0:
@@ -103,15 +148,42 @@ class StreamingUpload:
         return self._total > self._limit
 
 
-async def streaming_download(s3_object, chunk_size=4096):
+class StreamingDownload:
 
-    stream: StreamingResponse
-    async with s3_object["Body"] as stream:
-        while True:
-            data = await stream.read(chunk_size)
-            if not data:
-                return
-            yield data
+    """Iterates over body of downloaded object. Response
+    is released when body is read till the end or on error.
+    If client disconnects earlier, aclose() must be called"""
+
+    _stream: StreamingResponse
+    _chunk_size: int
+    _closed: bool
+
+    def __init__(self, s3_object, chunk_size=DOWNLOAD_CHUNK_SIZE):
+        self._stream = s3_object["Body"]
+        self._chunk_size = chunk_size
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+
+        try:
+            data = await self._stream.read(self._chunk_size)
+        except:
+            await self.aclose()
+            raise
+
+        if not data:
+            await self.aclose()
+            raise StopAsyncIteration
+
+        return data
+
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            await self._stream.__aexit__(None, None, None)
 
 
 class ObjectStorage:
@@ -173,7 +245,9 @@ class ObjectStorage:
         stream = StreamingUpload(chunks, upload_limit)
 
         try:
-            await self._client.upload_fileobj(stream, bucket_name, object_key)
+            await self._client.upload_fileobj(
+                stream, bucket_name, object_key, Config=UPLOAD_CONFIG
+            )
         except HTTPClientError as e:
             error = e.kwargs.get("error")
             if isinstance(error, CancelledError):
@@ -199,7 +273,7 @@ class ObjectStorage:
         object_key: str,
     ):
         obj = await self._client.get_object(Bucket=bucket_name, Key=object_key)
-        return streaming_download(obj)
+        return StreamingDownload(obj)
 
     @maybe_unknown_error
     @maybe_not_found
@@ -208,13 +282,85 @@ class ObjectStorage:
         bucket_name: str,
         object_key: str,
     ):
-        stream = BytesIO()
-        downloader = await self._streaming_download(bucket_name, object_key)
+        # Used for small objects only, which are returned as a whole.
+        # Read body at once instead of iterating over small chunks
+        obj = await self._client.get_object(Bucket=bucket_name, Key=object_key)
+
+        stream: StreamingResponse
+        async with obj["Body"] as stream:
+            return await stream.read()
+
+    async def _multipart_copy(
+        self,
+        copy_source: dict,
+        size: int,
+        bucket_name: str,
+        object_key: str,
+    ):
+        res = await self._client.create_multipart_upload(
+            Bucket=bucket_name, Key=object_key
+        )
 
-        async for chunk in downloader:
-            stream.write(chunk)
+        upload_id = res["UploadId"]
+        semaphore = asyncio.Semaphore(COPY_CONCURRENCY)
+
+        async def copy_part(part_number: int, first_byte: int):
+            last_byte = min(first_byte + COPY_PART_SIZE, size) - 1
+            async with semaphore:
+                res = await self._client.upload_part_copy(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    CopySource=copy_source,
+                    CopySourceRange=f"bytes={first_byte}-{last_byte}",
+                )
+
+            etag = res["CopyPartResult"]["ETag"]
+            return {"PartNumber": part_number, "ETag": etag}
+
+        offsets = range(0, size, COPY_PART_SIZE)
+        tasks = [
+            asyncio.ensure_future(copy_part(i, offset))
+            for i, offset in enumerate(offsets, start=1)
+        ]
 
-        return stream.getvalue()
+        try:
+            parts = await asyncio.gather(*tasks)
+            await self._client.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+
+        except:
+            for task in tasks:
+                task.cancel()
+
+            await self._client.abort_multipart_upload(
+                Bucket=bucket_name, Key=object_key, UploadId=upload_id
+            )
+            raise
+
+    async def _copy(
+        self,
+        copy_source: dict,
+        bucket_name: str,
+        object_key: str,
+    ):
+
+        """Copies object on server side, without downloading it"""
+
+        res = await self._client.head_object(**copy_source)
+        size = res["ContentLength"]
+
+        if size <= COPY_PART_SIZE:
+            await self._client.copy_object(
+                CopySource=copy_source, Bucket=bucket_name, Key=object_key
+            )
+        else:
+            await self._multipart_copy(copy_source, size, bucket_name, object_key)
 
     async def upload_fuzzer_config(
         self,
@@ -281,7 +427,7 @@ class ObjectStorage:
 
         try:
             copy_source = {"Bucket": src_bucket, "Key": src_key}
-            await self._client.copy(copy_source, dst_bucket, dst_key)
+            await self._copy(copy_source, dst_bucket, dst_key)
 
         except ClientError as e:
 
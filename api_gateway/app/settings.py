@@ -1,6 +1,7 @@
+import functools
 from contextlib import suppress
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 from pydantic import AnyHttpUrl, AnyUrl, BaseModel
 from pydantic import BaseSettings as _BaseSettings
@@ -19,13 +20,23 @@ class PlatformType(str, Enum):
 
 
 class BaseSettings(_BaseSettings):
+
+    # Names of plain str fields, collected once per class.
+    # Other str-like types (urls, emails) reject empty values themselves
+    __str_fields__: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__str_fields__ = frozenset(
+            name for name, field in cls.__fields__.items() if field.outer_type_ is str
+        )
+
     @root_validator
     def check_empty_strings(cls, data: Dict[str, Any]):
-        for name, value in data.items():
-            if isinstance(value, str):
-                if len(value) == 0:
-                    var = f"{cls.__name__}.{name}"
-                    raise ValueError(f"Variable '{var}': empty string not allowed")
+        for name in cls.__str_fields__:
+            if data.get(name) == "":
+                var = f"{cls.__name__}.{name}"
+                raise ValueError(f"Variable '{var}': empty string not allowed")
 
         return data
 
@@ -232,6 +243,9 @@ class APISettings(BaseSettings):
     client_module: str = Field(regex=r"^aiohttp$")
     endpoints: APIEndpointSettings
 
+    trust_internal: bool = False
+    """ Skip validation of responses received from internal services """
+
     class Config:
         env_prefix = "API_"
 
@@ -253,29 +267,24 @@ class AppSettings(BaseModel):
     fuzzer: FuzzerSettings
 
 
-_app_settings = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_app_settings() -> AppSettings:
 
-    global _app_settings
-
-    if _app_settings is None:
-        _app_settings = AppSettings(
-            database=DatabaseSettings(),
-            collections=CollectionSettings(),
-            object_storage=ObjectStorageSettings(buckets=S3Buckets()),
-            message_queue=MessageQueueSettings(queues=MessageQueues()),
-            api=APISettings(endpoints=APIEndpointSettings()),
-            csrf_protection=CSRFProtectionSettings(),
-            bfp=BruteforceProtectionSettings(),
-            environment=EnvironmentSettings(),
-            trashbin=TrashBinSettings(),
-            default_user=DefaultUserSettings(),
-            revision=RevisionSettings(),
-            root=SystemAdminSettings(),
-            cookies=CookieSettings(),
-            fuzzer=FuzzerSettings(),
-        )
-
-    return _app_settings
+    # Settings are loaded from environment once and then shared.
+    # Failed loads raise and are not cached, so they are retried
+    return AppSettings(
+        database=DatabaseSettings(),
+        collections=CollectionSettings(),
+        object_storage=ObjectStorageSettings(buckets=S3Buckets()),
+        message_queue=MessageQueueSettings(queues=MessageQueues()),
+        api=APISettings(endpoints=APIEndpointSettings()),
+        csrf_protection=CSRFProtectionSettings(),
+        bfp=BruteforceProtectionSettings(),
+        environment=EnvironmentSettings(),
+        trashbin=TrashBinSettings(),
+        default_user=DefaultUserSettings(),
+        revision=RevisionSettings(),
+        root=SystemAdminSettings(),
+        cookies=CookieSettings(),
+        fuzzer=FuzzerSettings(),
+    )
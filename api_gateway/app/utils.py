@@ -2,6 +2,7 @@ import functools
 import logging
 import random
 import string
+import time
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from logging import LoggerAdapter
@@ -89,48 +90,58 @@ def datetime_utcnow() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+# Time is formatted from unix timestamp directly,
+# without creating datetime and timezone objects
+RFC3339_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
 def rfc3339_now() -> str:
-    return datetime_utcnow().strftime(r"%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime(RFC3339_FORMAT, time.gmtime())
 
 
 def rfc3339_add(date: datetime, seconds: int) -> str:
-    return (date.replace(microsecond=0) + timedelta(seconds=seconds)).strftime(r"%Y-%m-%dT%H:%M:%SZ")
+    return (date + timedelta(seconds=seconds)).strftime(RFC3339_FORMAT)
 
 
 def future_seconds(seconds: int) -> int:
-    utcnow = datetime_utcnow().replace(microsecond=0)
-    return int((utcnow + timedelta(seconds=seconds)).timestamp())
+    return int(time.time()) + seconds
 
 
 def rfc3339_fut(seconds: int) -> str:
-    utcnow = datetime_utcnow().replace(microsecond=0)
-    return (utcnow + timedelta(seconds=seconds)).strftime(r"%Y-%m-%dT%H:%M:%SZ")
+    return time.strftime(RFC3339_FORMAT, time.gmtime(int(time.time()) + seconds))
 
 
 # returns True if date in past or now else - False
 def rfc3339_expired(date: str) -> bool:
     assert date.endswith("Z")
-    tmp = datetime.fromisoformat(date[:-1])
-    return tmp <= datetime_utcnow()
+    tmp = datetime.fromisoformat(date[:-1]).replace(tzinfo=timezone.utc)
+    return tmp.timestamp() <= time.time()
 
 
 def gen_unique_identifier(n=6) -> str:
-    timestamp = str(int(datetime_utcnow().replace(microsecond=0).timestamp()))
-    rand = "".join(random.choice(string.ascii_lowercase) for _ in range(n))
-    return f"{timestamp}-{rand}"
+    # Unix timestamp does not depend on timezone, so skip datetime
+    rand = "".join(random.choices(string.ascii_lowercase, k=n))
+    return f"{int(time.time())}-{rand}"
 
 
 class PrefixedLogger(LoggerAdapter):
+    def __init__(self, logger, extra):
+        super().__init__(logger, extra)
+        self._prefix = extra["prefix"]
+
     def process(self, msg, kwargs):
-        return f"{self.extra['prefix']} {msg}", kwargs
+        # LoggerAdapter calls it only for enabled levels
+        return f"{self._prefix} {msg}", kwargs
 
 
 from pydantic import BaseModel
 
 
 def _default(obj):
+    # Field values are stored in __dict__ as is. Serializer calls
+    # this hook again for nested models, so deep copy is not needed
     if isinstance(obj, BaseModel):
-        return obj.dict()
+        return obj.__dict__
     raise TypeError()
 
 
@@ -138,13 +149,16 @@ try:
     import orjson  # type: ignore
     from fastapi.responses import ORJSONResponse as JSONResponse  # noqa
 
-    json_dumps = lambda x: orjson.dumps(x, _default).decode()
-    json_loads = lambda x: orjson.loads(x)
+    def json_dumps(obj: Any) -> str:
+        # aiohttp encodes result of json_serialize itself, so it must be str
+        return orjson.dumps(obj, default=_default).decode()
+
+    json_loads = orjson.loads
 
 except ModuleNotFoundError:
 
     import json  # isort: skip
     from fastapi.responses import JSONResponse  # noqa
 
-    json_dumps = lambda x: json.dumps(x, default=_default)
-    json_loads = lambda x: json.loads(x)
+    json_dumps = functools.partial(json.dumps, default=_default)
+    json_loads = json.loads
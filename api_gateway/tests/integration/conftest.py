@@ -1,14 +1,18 @@
 import asyncio
+import functools
 import json
+import os
 import random
 import string
 import tarfile
 from io import BytesIO
-from typing import Optional
+from typing import Dict, List, Optional
 
 import pytest
 from fastapi.applications import FastAPI
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from starlette.status import HTTP_200_OK
 
 from api_gateway.app.api.base import BasePaginatorResponseModel, ItemCountResponseModel
 from api_gateway.app.api.handlers.auth import LoginRequestModel
@@ -89,6 +93,10 @@ PROGRAMMING_LANGS = [lang.value for lang in ORMLangID]
 NO_SUCH_ID = "77777777777777"
 TEST_SET_SIZE = 50
 
+# Bytes are immutable, so the same objects are returned every time
+_SMALL_BYTES = b"A" * 100
+_BIG_TAR_CHUNK = b"A" * 4096
+
 _root_user: ORMUser = None
 _admin_user: ORMUser
 _default_user: ORMUser = None
@@ -99,10 +107,29 @@ _default_image: ORMImage = None
 _default_lang: ORMLang = None
 _default_engine: ORMEngine = None
 _default_integration_type: ORMIntegrationType = None
+_default_session_cookies: Dict[str, str] = None
+_root_session_cookies: Dict[str, str] = None
+_admin_session_cookies: Dict[str, str] = None
 _db: IDatabase = None
 _app: FastAPI = None
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "no_db_reset: test only reads default objects, "
+        "so database is not restored before it",
+    )
+
+    # Workers have own collections, but share S3 buckets and message
+    # queues, which must exist in advance. Object keys are made of
+    # collection keys, which may be equal in different workers, so
+    # tests using S3 (test_revisions.py) must stay on one worker
+    dist = getattr(config.option, "dist", "no")
+    if dist not in ("no", "loadfile"):
+        raise pytest.UsageError("Integration tests require '--dist=loadfile'")
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.get_event_loop()
@@ -110,9 +137,26 @@ def event_loop():
     loop.close()
 
 
+def add_collection_suffix(collections: BaseModel, suffix: str):
+    for name, value in collections:
+        if isinstance(value, str):
+            setattr(collections, name, f"{value}_{suffix}")
+        else:
+            add_collection_suffix(value, suffix)
+
+
 @pytest.fixture(scope="session")
 def settings():
-    return get_app_settings()
+
+    # Settings object is shared with app, so changes are seen by it.
+    # Every pytest-xdist worker works with its own set of collections.
+    # Buckets and queues are shared (see pytest_configure)
+    _settings = get_app_settings()
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is not None:
+        add_collection_suffix(_settings.collections, worker)
+
+    return _settings
 
 
 @pytest.fixture(scope="session")
@@ -136,7 +180,6 @@ async def db(settings: AppSettings):
     global _db
     _db = await db_init(settings)
     yield _db
-    await _db.truncate_all_collections()
     await _db.close()
 
 
@@ -161,8 +204,15 @@ def reset_test_client(test_client: TestClient):
     test_client.cookies.clear()
 
 
-@pytest.fixture(autouse=True)
-async def reset_database(settings: AppSettings, db: IDatabase):
+@pytest.fixture(scope="session")
+async def seed_database(
+    settings: AppSettings,
+    db: IDatabase,
+    test_client: TestClient,
+):
+
+    """Fills database with default objects once per session.
+    Returns dump of database, which is restored before each test"""
 
     global _root_user
     global _admin_user
@@ -174,6 +224,9 @@ async def reset_database(settings: AppSettings, db: IDatabase):
     global _default_lang
     global _default_engine
     global _default_integration_type
+    global _default_session_cookies
+    global _root_session_cookies
+    global _admin_session_cookies
 
     await db.truncate_all_collections()
 
@@ -233,6 +286,41 @@ async def reset_database(settings: AppSettings, db: IDatabase):
     _default_engine = engine
     _default_integration_type = integration_type
 
+    # Sessions are stored in database. Users log in before
+    # dump is made, so they stay logged in after each restore
+    _default_session_cookies = login_and_get_cookies(
+        test_client,
+        settings.default_user.username,
+        settings.default_user.password,
+    )
+    _root_session_cookies = login_and_get_cookies(
+        test_client,
+        settings.root.username,
+        settings.root.password,
+    )
+    _admin_session_cookies = login_and_get_cookies(
+        test_client,
+        settings.default_user.username + "_admin",
+        settings.default_user.password + "_admin",
+    )
+
+    return await db.dump_all_collections()
+
+
+@pytest.fixture(autouse=True)
+async def reset_database(
+    request: pytest.FixtureRequest,
+    db: IDatabase,
+    seed_database: Dict[str, List[dict]],
+):
+    # Marked tests don't write to database and do not
+    # depend on objects, which previous tests could leave
+    if request.node.get_closest_marker("no_db_reset"):
+        return
+
+    # Keys of restored objects are the same, so seeded globals stay valid
+    await db.restore_all_collections(seed_database)
+
 
 class UserModel(CreateUserRequestModel):
     pass
@@ -282,6 +370,55 @@ class RevisionResUpdateModel(UpdateRevisionResourcesRequestModel):
     pass
 
 
+def login_and_get_cookies(test_client: TestClient, username: str, password: str):
+
+    login_data = LoginModel(
+        username=username,
+        password=password,
+        session_metadata=random_string(),
+    )
+
+    resp = test_client.post(app_url_for("login"), json=login_data.dict())
+    assert resp.status_code == HTTP_200_OK
+
+    cookies = dict(test_client.cookies)
+    test_client.cookies.clear()
+    return cookies
+
+
+@pytest.fixture(scope="session")
+def default_session_cookies():
+    return _default_session_cookies
+
+
+@pytest.fixture(scope="session")
+def root_session_cookies():
+    return _root_session_cookies
+
+
+@pytest.fixture(scope="session")
+def admin_session_cookies():
+    return _admin_session_cookies
+
+
+@pytest.fixture()
+def default_client(test_client: TestClient, default_session_cookies: Dict[str, str]):
+    test_client.cookies.update(default_session_cookies)
+    return test_client
+
+
+@pytest.fixture()
+def root_client(test_client: TestClient, root_session_cookies: Dict[str, str]):
+    test_client.cookies.update(root_session_cookies)
+    return test_client
+
+
+@pytest.fixture()
+def admin_client(test_client: TestClient, admin_session_cookies: Dict[str, str]):
+    test_client.cookies.update(admin_session_cookies)
+    return test_client
+
+
 def get_login_data(user: UserModel):
     return LoginModel(
         username=user.name,
@@ -414,6 +551,11 @@ def default_user():
     return _default_user
 
 
+@pytest.fixture()
+def default_user_id():
+    return _default_user.id
+
+
 @pytest.fixture()
 def default_lang():
     return _default_lang
@@ -464,7 +606,7 @@ def default_revision():
     return _default_revision
 
 
-def create_custom_image(
+async def create_custom_image(
     name: str,
     project_id: Optional[str] = None,
     image_type=ORMImageType.custom,
@@ -473,19 +615,16 @@ def create_custom_image(
     image_status=ORMImageStatus.ready,
 ):
     # TODO: rewrite
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(
-        _db.images.create(
-            name=name,
-            project_id=project_id,
-            description="Some image",
-            engines=[engine],
-            status=image_status,
-        )
+    return await _db.images.create(
+        name=name,
+        project_id=project_id,
+        description="Some image",
+        engines=[engine],
+        status=image_status,
     )
 
 
-def create_custom_revision(
+async def create_custom_revision(
     name: str,
     fuzzer_id: str,
     image_id: str,
@@ -498,26 +637,23 @@ def create_custom_revision(
     last_stop_date: Optional[str] = None,
     is_verified=False,
 ):
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(
-        _db.revisions.create(
-            name=name,
-            description="Some revision",
-            fuzzer_id=fuzzer_id,
-            image_id=image_id,
-            status=status,
-            health=health,
-            binaries=binaries,
-            seeds=seeds,
-            config=config,
-            is_verified=is_verified,
-            created=rfc3339_now(),
-            last_start_date=last_start_date,
-            last_stop_date=last_stop_date,
-            cpu_usage=1000,
-            ram_usage=1000,
-            tmpfs_size=1000,
-        )
+    return await _db.revisions.create(
+        name=name,
+        description="Some revision",
+        fuzzer_id=fuzzer_id,
+        image_id=image_id,
+        status=status,
+        health=health,
+        binaries=binaries,
+        seeds=seeds,
+        config=config,
+        is_verified=is_verified,
+        created=rfc3339_now(),
+        last_start_date=last_start_date,
+        last_stop_date=last_stop_date,
+        cpu_usage=1000,
+        ram_usage=1000,
+        tmpfs_size=1000,
     )
 
 
@@ -546,12 +682,8 @@ async def present_admin(db: IDatabase):
 
 @pytest.fixture()
 async def trashbin_users(db: IDatabase, settings: AppSettings):
-    tb_users = await db.users.generate_test_set(TEST_SET_SIZE, "trashbin_users")
     erasure_date = rfc3339_add(datetime_utcnow(), settings.trashbin.expiration_seconds)
-    for user in tb_users:
-        user.erasure_date = erasure_date
-        await db.users.update(user)
-
+    await db.users.generate_test_set(TEST_SET_SIZE, "trashbin_users", erasure_date)
     yield await db.users.list(
         paginator=Paginator(0, 0xFFFFFFFF),
         removal_state=ObjectRemovalState.trash_bin,
@@ -560,11 +692,8 @@ async def trashbin_users(db: IDatabase, settings: AppSettings):
 
 @pytest.fixture()
 async def trashbin_user(db: IDatabase, settings: AppSettings):
-    users = await db.users.generate_test_set(1, "trashbin_user")
-    users[0].erasure_date = rfc3339_add(
-        datetime_utcnow(), settings.trashbin.expiration_seconds
-    )
-    await db.users.update(users[0])
+    erasure_date = rfc3339_add(datetime_utcnow(), settings.trashbin.expiration_seconds)
+    users = await db.users.generate_test_set(1, "trashbin_user", erasure_date)
     yield users[0]
 
 
@@ -581,12 +710,7 @@ async def trashbin_admin(db: IDatabase, settings: AppSettings):
 
 @pytest.fixture()
 async def erasing_users(db: IDatabase):
-    er_users = await db.users.generate_test_set(TEST_SET_SIZE, "erasing_users")
-    erasure_date = rfc3339_now()
-    for user in er_users:
-        user.erasure_date = erasure_date
-        await db.users.update(user)
-
+    await db.users.generate_test_set(TEST_SET_SIZE, "erasing_users", rfc3339_now())
     yield await db.users.list(
         paginator=Paginator(0, 0xFFFFFFFF),
         removal_state=ObjectRemovalState.erasing,
@@ -595,9 +719,7 @@ async def erasing_users(db: IDatabase):
 
 @pytest.fixture()
 async def erasing_user(db: IDatabase):
-    users = await db.users.generate_test_set(1, "erasing_user")
-    users[0].erasure_date = rfc3339_now()
-    await db.users.update(users[0])
+    users = await db.users.generate_test_set(1, "erasing_user", rfc3339_now())
     yield users[0]
 
 
@@ -637,11 +759,13 @@ def small_json():
 
 
 def small_bytes():
-    return b"A" * 100
+    return _SMALL_BYTES
 
 
+@functools.lru_cache(maxsize=1)
 def small_tar():
 
+    # Archive is the same for every test, so it's built once
     f = BytesIO()
     with tarfile.open(fileobj=f, mode="w:gz") as tar:
         blob = b"A" * 1000
@@ -654,24 +778,35 @@ def small_tar():
 
 def big_tar(gt: int):
 
-    chunk_size = 4096
-    chunks = gt // chunk_size
+    chunks = gt // len(_BIG_TAR_CHUNK)
 
     yield small_tar()
     for _ in range(chunks + 1):
-        yield b"A" * chunk_size
+        yield _BIG_TAR_CHUNK
 
 
 def unordered_unique_match(left: list, right: list):
+
+    # Lists of the same length without duplicates
+    # match if every item of right one is in left one
+    if len(left) != len(right):
+        return False
+
     set_left = set(left)
-    set_right = set(right)
-    no_duplicates_left = len(left) == len(set_left)
-    no_duplicates_right = len(right) == len(set_right)
-    return set_left == set_right and no_duplicates_left and no_duplicates_right
+    if len(set_left) != len(left):
+        return False
+
+    seen = set()
+    for item in right:
+        if item in seen or item not in set_left:
+            return False
+        seen.add(item)
+
+    return True
 
 
 def random_string(size=24, chars=string.ascii_lowercase):
-    return "".join(random.choice(chars) for _ in range(size))
+    return "".join(random.choices(chars, k=size))
 
 
 def app_url_for(name: str, **kwargs):
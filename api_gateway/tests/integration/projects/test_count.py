@@ -47,8 +47,8 @@ def test_access_check(
 
 def test_count_projects_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_projects: List[ORMProject],
 ):
     """
@@ -59,15 +59,9 @@ def test_count_projects_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Count projects with page size 10
-    user_id = json["user_id"]
-    url = app.url_path_for("get_project_count", user_id=user_id)
-    resp = test_client.get(url, params=dict(pg_size=10))
+    url = app.url_path_for("get_project_count", user_id=default_user_id)
+    resp = default_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -87,8 +81,8 @@ def test_count_projects_ok(
 
 def test_count_project_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_projects: List[ORMProject],
     default_project: ORMProject,
 ):
@@ -100,22 +94,16 @@ def test_count_project_deleted(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Delete project
-    user_id = json["user_id"]
-    url_params = {"user_id": user_id, "project_id": default_project.id}
+    url_params = {"user_id": default_user_id, "project_id": default_project.id}
     body_params_delete = {"action": DeleteActions.delete, "no_backup": False}
     url_delete = app.url_path_for("delete_project", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Count users with page size 10
-    resp = test_client.get(
-        url=app.url_path_for("get_project_count", user_id=user_id),
+    resp = default_client.get(
+        url=app.url_path_for("get_project_count", user_id=default_user_id),
         params=dict(
             pg_size=10,
             removal_state=UserObjectRemovalState.all,
@@ -138,8 +126,8 @@ def test_count_project_deleted(
     assert pg_total == n_chunks or pg_total == n_chunks + 1
 
     # Count only deleted projects
-    resp = test_client.get(
-        url=app.url_path_for("get_project_count", user_id=user_id),
+    resp = default_client.get(
+        url=app.url_path_for("get_project_count", user_id=default_user_id),
         params=dict(
             removal_state=UserObjectRemovalState.trash_bin,
         ),
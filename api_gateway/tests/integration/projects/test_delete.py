@@ -1,3 +1,4 @@
+import pytest
 from fastapi.applications import FastAPI
 from fastapi.testclient import TestClient
 from starlette.status import *
@@ -6,13 +7,13 @@ from api_gateway.app.api.base import DeleteActions
 from api_gateway.app.api.error_codes import *
 from api_gateway.app.database.orm import ORMProject
 
-from ..conftest import NO_SUCH_ID, LoginModel
+from ..conftest import NO_SUCH_ID
 
 
 def test_delete_project_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
 ):
     """
@@ -23,24 +24,19 @@ def test_delete_project_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Delete project
-    user_id = json["user_id"]
-    url_params = {"user_id": user_id, "project_id": default_project.id}
+    url_params = {"user_id": default_user_id, "project_id": default_project.id}
     body_params_delete = {"action": DeleteActions.delete, "no_backup": False}
     url_delete = app.url_path_for("delete_project", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
 
+@pytest.mark.no_db_reset
 def test_delete_project_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
 ):
     """
     Description
@@ -50,17 +46,11 @@ def test_delete_project_not_found(
         If delete operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Delete project
-    user_id = json["user_id"]
-    url_params = {"user_id": user_id, "project_id": NO_SUCH_ID}
+    url_params = {"user_id": default_user_id, "project_id": NO_SUCH_ID}
     body_params_delete = {"action": DeleteActions.delete, "no_backup": False}
     url_delete = app.url_path_for("delete_project", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     json = resp.json()
 
     # Ensure delete operation failed
@@ -70,8 +60,8 @@ def test_delete_project_not_found(
 
 def test_delete_project_twice(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
 ):
     """
@@ -82,21 +72,15 @@ def test_delete_project_twice(
         If second delete operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Delete project
-    user_id = json["user_id"]
-    url_params = {"user_id": user_id, "project_id": default_project.id}
+    url_params = {"user_id": default_user_id, "project_id": default_project.id}
     body_params_delete = {"action": DeleteActions.delete, "no_backup": False}
     url_delete = app.url_path_for("delete_project", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Delete project second time
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     json = resp.json()
 
     # Ensure second delete operation failed
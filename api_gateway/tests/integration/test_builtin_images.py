@@ -1,5 +1,6 @@
 from typing import List
 
+import pytest
 from fastapi.applications import FastAPI
 from fastapi.testclient import TestClient
 from starlette.status import *
@@ -60,8 +61,7 @@ def test_administrator_required(
 
 def test_create_image_ok(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -73,20 +73,15 @@ def test_create_image_ok(
         If no errors were encountered
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create builtin image
     operation = "create_builtin_image"
-    resp = test_client.post(app.url_path_for(operation), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(operation), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
 
 
 def test_create_image_already_exists(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -97,17 +92,13 @@ def test_create_image_already_exists(
         If creation failed
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create builtin image
     operation = "create_builtin_image"
-    resp = test_client.post(app.url_path_for(operation), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(operation), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
 
     # Create builtin image twice
-    resp = test_client.post(app.url_path_for(operation), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(operation), json=builtin_image.dict())
     json = resp.json()
 
     # Ensure second creation failed
@@ -117,8 +108,7 @@ def test_create_image_already_exists(
 
 def test_get_image_ok(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -132,18 +122,14 @@ def test_get_image_ok(
     operation = "create_builtin_image"
     operation_g = "get_builtin_image"
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create builtin image
-    resp = test_client.post(app.url_path_for(operation), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(operation), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
     json = resp.json()
 
     # Get image
     url = app.url_path_for(operation_g, image_id=json["id"])
-    resp = test_client.get(url)
+    resp = root_client.get(url)
     json = resp.json()
 
     # Ensure record found and has data fields
@@ -151,10 +137,10 @@ def test_get_image_ok(
     assert all(k in json for k in IMAGE_FIELDS)
 
 
+@pytest.mark.no_db_reset
 def test_get_image_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
 ):
     """
     Description
@@ -164,19 +150,14 @@ def test_get_image_not_found(
         If get operation failed
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Get image
     url = app.url_path_for("get_builtin_image", image_id=NO_SUCH_ID)
-    assert test_client.get(url).status_code == HTTP_404_NOT_FOUND
+    assert root_client.get(url).status_code == HTTP_404_NOT_FOUND
 
 
 def test_list_images_ok(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -187,17 +168,13 @@ def test_list_images_ok(
         If no errors were encountered
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create builtin image
     operation = "create_builtin_image"
-    resp = test_client.post(app.url_path_for(operation), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(operation), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
 
     # List images
-    resp = test_client.get(app.url_path_for("list_builtin_images"))
+    resp = root_client.get(app.url_path_for("list_builtin_images"))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -209,8 +186,7 @@ def test_list_images_ok(
 
 def test_count_images_ok(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     list_of_builtin_images: List[ORMUser],
 ):
     """
@@ -221,13 +197,9 @@ def test_count_images_ok(
         If no errors were encountered
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Count users with page size 10
     url = app.url_path_for("get_builtin_image_count")
-    resp = test_client.get(url, params=dict(pg_size=10))
+    resp = root_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -247,8 +219,7 @@ def test_count_images_ok(
 
 def test_list_image_pagination(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     list_of_builtin_images: List[ORMUser],
     default_image: ORMImage,
 ):
@@ -263,10 +234,6 @@ def test_list_image_pagination(
     created_images = [img.name for img in list_of_builtin_images]
     fetched_images = []
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # List images using pagination
     created_images.append(default_image.name)
     url = app.url_path_for("list_builtin_images")
@@ -275,7 +242,7 @@ def test_list_image_pagination(
     while True:
 
         # Each page contains up to `pg_size` records
-        resp = test_client.get(url, params=dict(pg_num=pg_num))
+        resp = root_client.get(url, params=dict(pg_num=pg_num))
         assert resp.status_code == HTTP_200_OK
         json = resp.json()
 
@@ -293,8 +260,7 @@ def test_list_image_pagination(
 
 def test_list_image_pagination_with_count(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     list_of_builtin_images: List[ORMUser],
     default_image: ORMImage,
 ):
@@ -309,14 +275,10 @@ def test_list_image_pagination_with_count(
     created_images = [image.name for image in list_of_builtin_images]
     fetched_images = []
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Count images with page size 10
     created_images.append(default_image.name)
     url = app.url_path_for("get_builtin_image_count")
-    resp = test_client.get(url, params=dict(pg_size=10))
+    resp = root_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -328,7 +290,7 @@ def test_list_image_pagination_with_count(
     for pg_num in range(pg_total):
 
         # Each page contains up to `pg_size` records
-        resp = test_client.get(url, params=dict(pg_num=pg_num, pg_size=pg_size))
+        resp = root_client.get(url, params=dict(pg_num=pg_num, pg_size=pg_size))
         assert resp.status_code == HTTP_200_OK
         json = resp.json()
 
@@ -341,8 +303,7 @@ def test_list_image_pagination_with_count(
 
 def test_modify_image_ok(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -357,12 +318,8 @@ def test_modify_image_ok(
     op_update = "update_builtin_image"
     operation_g = "get_builtin_image"
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create image
-    resp = test_client.post(app.url_path_for(op_create), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(op_create), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
     created_image = resp.json()
 
@@ -370,12 +327,12 @@ def test_modify_image_ok(
     updated_name = "myimg"
     updates = ImageUpdateModel(name=updated_name)
     url = app.url_path_for(op_update, image_id=created_image["id"])
-    resp = test_client.patch(url, json=updates.dict(exclude_unset=True))
+    resp = root_client.patch(url, json=updates.dict(exclude_unset=True))
     assert resp.status_code == HTTP_200_OK
 
     # Get image
     url = app.url_path_for(operation_g, image_id=created_image["id"])
-    resp = test_client.get(url)
+    resp = root_client.get(url)
     json = resp.json()
 
     # Ensure changes are correct (in fact)
@@ -384,8 +341,7 @@ def test_modify_image_ok(
 
 def test_modify_image_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
 ):
     """
     Description
@@ -395,14 +351,10 @@ def test_modify_image_not_found(
         If modify operation failed
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Update image which does not exist
     updates = UserUpdateModel(name="aaa")
     url = app.url_path_for("update_builtin_image", image_id=NO_SUCH_ID)
-    resp = test_client.patch(url, json=updates.dict(exclude_unset=True))
+    resp = root_client.patch(url, json=updates.dict(exclude_unset=True))
     json = resp.json()
 
     # Ensure update operation failed
@@ -412,8 +364,7 @@ def test_modify_image_not_found(
 
 def test_modify_image_name_exists(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
 ):
     """
     Description
@@ -427,25 +378,21 @@ def test_modify_image_name_exists(
     op_create = "create_builtin_image"
     op_update = "update_builtin_image"
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create image (1)
     image1 = gen_builtin_image()
-    resp = test_client.post(app.url_path_for(op_create), json=image1.dict())
+    resp = root_client.post(app.url_path_for(op_create), json=image1.dict())
     assert resp.status_code == HTTP_201_CREATED
 
     # Create image (2)
     image2 = gen_builtin_image()
-    resp = test_client.post(app.url_path_for(op_create), json=image2.dict())
+    resp = root_client.post(app.url_path_for(op_create), json=image2.dict())
     assert resp.status_code == HTTP_201_CREATED
     created_image2 = resp.json()
 
     # Update image with existing image name
     updates = UserUpdateModel(name=image1.name)
     url = app.url_path_for(op_update, image_id=created_image2["id"])
-    resp = test_client.patch(url, json=updates.dict(exclude_unset=True))
+    resp = root_client.patch(url, json=updates.dict(exclude_unset=True))
     json = resp.json()
 
     # Ensure update failed
@@ -455,8 +402,7 @@ def test_modify_image_name_exists(
 
 def test_delete_image_ok(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -470,24 +416,19 @@ def test_delete_image_ok(
     op_create = "create_builtin_image"
     op_delete = "delete_builtin_image"
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create builtin image
-    resp = test_client.post(app.url_path_for(op_create), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(op_create), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
     json = resp.json()
 
     # Delete image
     url = app.url_path_for(op_delete, image_id=json["id"])
-    assert test_client.delete(url).status_code == HTTP_200_OK
+    assert root_client.delete(url).status_code == HTTP_200_OK
 
 
 def test_delete_image_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
 ):
     """
     Description
@@ -497,13 +438,9 @@ def test_delete_image_not_found(
         If delete operation failed
     """
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Delete image
     url = app.url_path_for("delete_builtin_image", image_id=NO_SUCH_ID)
-    resp = test_client.delete(url)
+    resp = root_client.delete(url)
     json = resp.json()
 
     # Ensure delete operation failed
@@ -513,8 +450,7 @@ def test_delete_image_not_found(
 
 def test_delete_image_twice(
     app: FastAPI,
-    test_client: TestClient,
-    root_login_data: LoginModel,
+    root_client: TestClient,
     builtin_image: ImageModel,
 ):
     """
@@ -528,22 +464,18 @@ def test_delete_image_twice(
     op_create = "create_builtin_image"
     op_delete = "delete_builtin_image"
 
-    # Login as root
-    resp = test_client.post(app.url_path_for("login"), json=root_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-
     # Create builtin image
-    resp = test_client.post(app.url_path_for(op_create), json=builtin_image.dict())
+    resp = root_client.post(app.url_path_for(op_create), json=builtin_image.dict())
     assert resp.status_code == HTTP_201_CREATED
     json = resp.json()
 
     # Delete image
     url = app.url_path_for(op_delete, image_id=json["id"])
-    assert test_client.delete(url).status_code == HTTP_200_OK
+    assert root_client.delete(url).status_code == HTTP_200_OK
 
     # Delete image second time
     url = app.url_path_for(op_delete, image_id=json["id"])
-    resp = test_client.delete(url)
+    resp = root_client.delete(url)
     json = resp.json()
 
     # Ensure second delete operation failed
@@ -100,7 +100,8 @@ def test_get_platform_config(
 
 # TODO: rewrite
 @pytest.mark.skip
-def test_list_available_images(
+@pytest.mark.asyncio()
+async def test_list_available_images(
     app: FastAPI,
     test_client: TestClient,
     default_login_data: LoginModel,
@@ -124,7 +125,7 @@ def test_list_available_images(
     for i, image_type in enumerate(ORMImageType):
         for j, lang in enumerate(ORMLangID):
             for k, engine in enumerate(ORMEngineID):
-                create_custom_image(
+                await create_custom_image(
                     owner_id=user_id,
                     name=f"image-{i}-{j}-{k}",
                     image_type=image_type,
@@ -165,7 +166,8 @@ def test_list_available_images(
 
 # TODO: rewrite
 @pytest.mark.skip
-def test_count_available_images(
+@pytest.mark.asyncio()
+async def test_count_available_images(
     app: FastAPI,
     test_client: TestClient,
     default_login_data: LoginModel,
@@ -189,7 +191,7 @@ def test_count_available_images(
     for i, image_type in enumerate(ORMImageType):
         for j, lang in enumerate(ORMLangID):
             for k, engine in enumerate(ORMEngineID):
-                create_custom_image(
+                await create_custom_image(
                     owner_id=user_id,
                     name=f"image-{i}-{j}-{k}",
                     image_type=image_type,
@@ -182,8 +182,8 @@ def test_create_fuzzer_in_trashbin(
 
 def test_get_fuzzer_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -195,20 +195,15 @@ def test_get_fuzzer_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
 
     # Get fuzzer
-    resp = test_client.get(app.url_path_for("get_fuzzer", **url_params))
+    resp = default_client.get(app.url_path_for("get_fuzzer", **url_params))
     json = resp.json()
 
     # Ensure record found and has data fields
@@ -218,8 +213,8 @@ def test_get_fuzzer_ok(
 
 def test_get_fuzzer_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
 ):
     """
@@ -230,27 +225,22 @@ def test_get_fuzzer_not_found(
         If get operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": NO_SUCH_ID,
     }
 
     # Get fuzzer
     url_get = app.url_path_for("get_fuzzer", **url_params)
-    assert test_client.get(url_get).status_code == HTTP_404_NOT_FOUND
+    assert default_client.get(url_get).status_code == HTTP_404_NOT_FOUND
 
 
 def test_get_fuzzer_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -262,14 +252,9 @@ def test_get_fuzzer_deleted(
         If get operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -277,12 +262,12 @@ def test_get_fuzzer_deleted(
 
     # Delete fuzzer (will be moved to trash bin)
     url_delete = app.url_path_for("delete_fuzzer", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Get deleted fuzzer
     url_get = app.url_path_for("get_fuzzer", **url_params)
-    resp = test_client.get(url_get)
+    resp = default_client.get(url_get)
     json = resp.json()
 
     # Ensure record found and has data fields
@@ -292,8 +277,8 @@ def test_get_fuzzer_deleted(
 
 def test_list_fuzzers_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
 ):
     """
@@ -304,19 +289,14 @@ def test_list_fuzzers_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
     }
 
     # List fuzzers
-    resp = test_client.get(app.url_path_for("list_fuzzers", **url_params))
+    resp = default_client.get(app.url_path_for("list_fuzzers", **url_params))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -331,8 +311,8 @@ def test_list_fuzzers_ok(
 )
 def test_list_fuzzers_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     removal_state: UserObjectRemovalState,
@@ -345,14 +325,9 @@ def test_list_fuzzers_deleted(
         If deleted users were included in the results
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for list
     url_params_list = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
     }
 
@@ -365,11 +340,11 @@ def test_list_fuzzers_deleted(
 
     # Delete fuzzer
     url_delete = app.url_path_for("delete_fuzzer", **url_params_delete)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # List fuzzers
-    resp = test_client.get(
+    resp = default_client.get(
         url=app.url_path_for("list_fuzzers", **url_params_list),
         params=dict(
             pg_size=100,
@@ -389,8 +364,8 @@ def test_list_fuzzers_deleted(
 
 def test_count_fuzzers_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_fuzzers: List[ORMFuzzer],
     default_project: ORMProject,
 ):
@@ -402,20 +377,15 @@ def test_count_fuzzers_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
     }
 
     # Count fuzzers with page size 10
     url = app.url_path_for("get_fuzzer_count", **url_params)
-    resp = test_client.get(url, params=dict(pg_size=10))
+    resp = default_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -435,8 +405,8 @@ def test_count_fuzzers_ok(
 
 def test_count_fuzzer_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_fuzzers: List[ORMFuzzer],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -449,14 +419,9 @@ def test_count_fuzzer_deleted(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for count
     url_params_count = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
     }
 
@@ -469,11 +434,11 @@ def test_count_fuzzer_deleted(
 
     # Delete fuzzer
     url_delete = app.url_path_for("delete_fuzzer", **url_params_delete)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Count users with page size 10
-    resp = test_client.get(
+    resp = default_client.get(
         url=app.url_path_for("get_fuzzer_count", **url_params_count),
         params=dict(
             pg_size=10,
@@ -497,7 +462,7 @@ def test_count_fuzzer_deleted(
     assert pg_total == n_chunks or pg_total == n_chunks + 1
 
     # Count only deleted fuzzers
-    resp = test_client.get(
+    resp = default_client.get(
         url=app.url_path_for("get_fuzzer_count", **url_params_count),
         params=dict(
             removal_state=UserObjectRemovalState.trash_bin,
@@ -512,8 +477,8 @@ def test_count_fuzzer_deleted(
 
 def test_list_fuzzer_pagination(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_fuzzers: List[ORMUser],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -529,14 +494,9 @@ def test_list_fuzzer_pagination(
     created_fuzzers = [fuzzer.name for fuzzer in list_of_fuzzers]
     fetched_fuzzers = []
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for list
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
     }
 
@@ -548,7 +508,7 @@ def test_list_fuzzer_pagination(
     while True:
 
         # Each page contains up to `pg_size` records
-        resp = test_client.get(url, params=dict(pg_num=pg_num))
+        resp = default_client.get(url, params=dict(pg_num=pg_num))
         assert resp.status_code == HTTP_200_OK
         json = resp.json()
 
@@ -566,8 +526,8 @@ def test_list_fuzzer_pagination(
 
 def test_list_fuzzer_pagination_with_count(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_fuzzers: List[ORMUser],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -583,21 +543,16 @@ def test_list_fuzzer_pagination_with_count(
     created_fuzzers = [fuzzer.name for fuzzer in list_of_fuzzers]
     fetched_fuzzers = []
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for list
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
     }
 
     # Count fuzzers with page size 10
     created_fuzzers.append(default_fuzzer.name)
     url = app.url_path_for("get_fuzzer_count", **url_params)
-    resp = test_client.get(url, params=dict(pg_size=10))
+    resp = default_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -609,7 +564,7 @@ def test_list_fuzzer_pagination_with_count(
     for pg_num in range(pg_total):
 
         # Each page contains up to `pg_size` records
-        resp = test_client.get(url, params=dict(pg_num=pg_num, pg_size=pg_size))
+        resp = default_client.get(url, params=dict(pg_num=pg_num, pg_size=pg_size))
         assert resp.status_code == HTTP_200_OK
         json = resp.json()
 
@@ -795,8 +750,8 @@ def test_modify_fuzzer_deleted(
 
 def test_delete_fuzzer_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -808,14 +763,9 @@ def test_delete_fuzzer_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -823,14 +773,14 @@ def test_delete_fuzzer_ok(
 
     # Delete fuzzer
     url_delete = app.url_path_for("delete_fuzzer", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
 
 def test_delete_fuzzer_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
 ):
     """
@@ -841,14 +791,9 @@ def test_delete_fuzzer_not_found(
         If delete operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": NO_SUCH_ID,
     }
@@ -856,7 +801,7 @@ def test_delete_fuzzer_not_found(
 
     # Delete fuzzer
     url_delete = app.url_path_for("delete_fuzzer", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     json = resp.json()
 
     # Ensure delete operation failed
@@ -866,8 +811,8 @@ def test_delete_fuzzer_not_found(
 
 def test_delete_fuzzer_twice(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -879,14 +824,9 @@ def test_delete_fuzzer_twice(
         If second delete operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -894,11 +834,11 @@ def test_delete_fuzzer_twice(
 
     # Delete fuzzer
     url_delete = app.url_path_for("delete_fuzzer", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Delete fuzzer second time
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     json = resp.json()
 
     # Ensure second delete operation failed
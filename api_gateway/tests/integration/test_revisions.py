@@ -258,8 +258,8 @@ def test_create_revision_in_trashbin(
 
 def test_get_revision_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -272,21 +272,16 @@ def test_get_revision_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
     }
 
     # Get revision
-    resp = test_client.get(app.url_path_for("get_revision", **url_params))
+    resp = default_client.get(app.url_path_for("get_revision", **url_params))
     json = resp.json()
 
     # Ensure record found and has data fields
@@ -296,8 +291,8 @@ def test_get_revision_ok(
 
 def test_get_revision_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -309,14 +304,9 @@ def test_get_revision_not_found(
         If get operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": NO_SUCH_ID,
@@ -324,13 +314,13 @@ def test_get_revision_not_found(
 
     # Get revision
     url_get = app.url_path_for("get_revision", **url_params)
-    assert test_client.get(url_get).status_code == HTTP_404_NOT_FOUND
+    assert default_client.get(url_get).status_code == HTTP_404_NOT_FOUND
 
 
 def test_get_revision_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -343,14 +333,9 @@ def test_get_revision_deleted(
         If get operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -362,12 +347,12 @@ def test_get_revision_deleted(
 
     # Delete revision (will be moved to trash bin)
     url_delete = app.url_path_for("delete_revision", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Get deleted revision
     url_get = app.url_path_for("get_revision", **url_params)
-    resp = test_client.get(url_get)
+    resp = default_client.get(url_get)
     json = resp.json()
 
     # Ensure record found and has data fields
@@ -380,8 +365,8 @@ def test_get_revision_deleted(
 
 def test_list_revisions_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -393,20 +378,15 @@ def test_list_revisions_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
 
     # List revisions
-    resp = test_client.get(app.url_path_for("list_revisions", **url_params))
+    resp = default_client.get(app.url_path_for("list_revisions", **url_params))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -421,8 +401,8 @@ def test_list_revisions_ok(
 )
 def test_list_revisions_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -436,14 +416,9 @@ def test_list_revisions_deleted(
         If deleted users were included in the results
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for list
     url_params_list = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -460,11 +435,11 @@ def test_list_revisions_deleted(
 
     # Delete revision
     url_delete = app.url_path_for("delete_revision", **url_params_delete)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # List revisions
-    resp = test_client.get(
+    resp = default_client.get(
         url=app.url_path_for("list_revisions", **url_params_list),
         params=dict(
             pg_size=100,
@@ -484,8 +459,8 @@ def test_list_revisions_deleted(
 
 def test_count_revisions_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_revisions: List[ORMRevision],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -498,21 +473,16 @@ def test_count_revisions_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
 
     # Count revisions with page size 10
     url = app.url_path_for("get_revision_count", **url_params)
-    resp = test_client.get(url, params=dict(pg_size=10))
+    resp = default_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -532,8 +502,8 @@ def test_count_revisions_ok(
 
 def test_count_revisions_deleted(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_revisions: List[ORMRevision],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -547,14 +517,9 @@ def test_count_revisions_deleted(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for count
     url_params_count = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -571,11 +536,11 @@ def test_count_revisions_deleted(
 
     # Delete revision
     url_delete = app.url_path_for("delete_revision", **url_params_delete)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Count users with page size 10
-    resp = test_client.get(
+    resp = default_client.get(
         url=app.url_path_for("get_revision_count", **url_params_count),
         params=dict(
             pg_size=10,
@@ -599,7 +564,7 @@ def test_count_revisions_deleted(
     assert pg_total == n_chunks or pg_total == n_chunks + 1
 
     # Count only deleted revisions
-    resp = test_client.get(
+    resp = default_client.get(
         url=app.url_path_for("get_revision_count", **url_params_count),
         params=dict(
             removal_state=UserObjectRemovalState.trash_bin,
@@ -614,8 +579,8 @@ def test_count_revisions_deleted(
 
 def test_list_revisions_pagination(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_revisions: List[ORMUser],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -632,14 +597,9 @@ def test_list_revisions_pagination(
     created_revisions = [revision.name for revision in list_of_revisions]
     fetched_revisions = []
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for list
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -652,7 +612,7 @@ def test_list_revisions_pagination(
     while True:
 
         # Each page contains up to `pg_size` records
-        resp = test_client.get(url, params=dict(pg_num=pg_num))
+        resp = default_client.get(url, params=dict(pg_num=pg_num))
         assert resp.status_code == HTTP_200_OK
         json = resp.json()
 
@@ -670,8 +630,8 @@ def test_list_revisions_pagination(
 
 def test_list_revisions_pagination_with_count(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     list_of_revisions: List[ORMUser],
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
@@ -688,14 +648,9 @@ def test_list_revisions_pagination_with_count(
     created_revisions = [revision.name for revision in list_of_revisions]
     fetched_revisions = []
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params for list
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
     }
@@ -703,7 +658,7 @@ def test_list_revisions_pagination_with_count(
     # Count revisions with page size 10
     created_revisions.append(default_revision.name)
     url = app.url_path_for("get_revision_count", **url_params)
-    resp = test_client.get(url, params=dict(pg_size=10))
+    resp = default_client.get(url, params=dict(pg_size=10))
     assert resp.status_code == HTTP_200_OK
     json = resp.json()
 
@@ -715,7 +670,7 @@ def test_list_revisions_pagination_with_count(
     for pg_num in range(pg_total):
 
         # Each page contains up to `pg_size` records
-        resp = test_client.get(url, params=dict(pg_num=pg_num, pg_size=pg_size))
+        resp = default_client.get(url, params=dict(pg_num=pg_num, pg_size=pg_size))
         assert resp.status_code == HTTP_200_OK
         json = resp.json()
 
@@ -969,8 +924,8 @@ def test_update_revision_deleted(
 
 def test_delete_revision_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -983,14 +938,9 @@ def test_delete_revision_ok(
         If no errors were encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1002,18 +952,18 @@ def test_delete_revision_ok(
 
     # Delete revision
     url_delete = app.url_path_for("delete_revision", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Get revision
     url_get = app.url_path_for("get_revision", **url_params)
-    assert test_client.get(url_get).status_code == HTTP_200_OK
+    assert default_client.get(url_get).status_code == HTTP_200_OK
 
 
 def test_delete_revision_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
 ):
@@ -1025,14 +975,9 @@ def test_delete_revision_not_found(
         If delete operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": NO_SUCH_ID,
@@ -1044,7 +989,7 @@ def test_delete_revision_not_found(
 
     # Delete revision
     url_delete = app.url_path_for("delete_revision", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     json = resp.json()
 
     # Ensure delete operation failed
@@ -1054,8 +999,8 @@ def test_delete_revision_not_found(
 
 def test_delete_revision_twice(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -1068,14 +1013,9 @@ def test_delete_revision_twice(
         If second delete operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1087,11 +1027,11 @@ def test_delete_revision_twice(
 
     # Delete revision
     url_delete = app.url_path_for("delete_revision", **url_params)
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     assert resp.status_code == HTTP_200_OK
 
     # Delete revision second time
-    resp = test_client.delete(url_delete, params=body_params_delete)
+    resp = default_client.delete(url_delete, params=body_params_delete)
     json = resp.json()
 
     # Ensure second delete operation failed
@@ -1099,10 +1039,11 @@ def test_delete_revision_twice(
     assert json["code"] == E_REVISION_DELETED
 
 
-def test_delete_running_revision(
+@pytest.mark.asyncio()
+async def test_delete_running_revision(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_image: ORMImage,
@@ -1116,13 +1057,8 @@ def test_delete_running_revision(
         If operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Create revision with custom status
-    revision = create_custom_revision(
+    revision = await create_custom_revision(
         "custom",
         default_fuzzer.id,
         default_image.id,
@@ -1131,7 +1067,7 @@ def test_delete_running_revision(
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": revision.id,
@@ -1143,7 +1079,7 @@ def test_delete_running_revision(
 
     # Delete revision
     url = app.url_path_for("delete_revision", **url_params)
-    resp = test_client.delete(url, params=body_params_delete)
+    resp = default_client.delete(url, params=body_params_delete)
     json = resp.json()
 
     # Ensure delete succeeded
@@ -1232,8 +1168,8 @@ def test_access_another_user(
 
 def test_upload_files_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -1246,14 +1182,9 @@ def test_upload_files_ok(
         If upload succeeded
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1261,24 +1192,24 @@ def test_upload_files_ok(
 
     # Upload binaries
     url_binaries = app.url_path_for("upload_revision_binaries", **url_params)
-    resp = test_client.put(url_binaries, data=small_tar())
+    resp = default_client.put(url_binaries, data=small_tar())
     assert resp.status_code == HTTP_200_OK
 
     # Upload seeds
     url_seeds = app.url_path_for("upload_revision_seeds", **url_params)
-    resp = test_client.put(url_seeds, data=small_tar())
+    resp = default_client.put(url_seeds, data=small_tar())
     assert resp.status_code == HTTP_200_OK
 
     # Upload config
     url_config = app.url_path_for("upload_revision_config", **url_params)
-    resp = test_client.put(url_config, data=small_json())
+    resp = default_client.put(url_config, data=small_json())
     assert resp.status_code == HTTP_200_OK
 
 
 def test_upload_files_failed_content_invalid(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -1291,14 +1222,9 @@ def test_upload_files_failed_content_invalid(
         If upload failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1306,37 +1232,33 @@ def test_upload_files_failed_content_invalid(
 
     # Upload binaries
     url_binaries = app.url_path_for("upload_revision_binaries", **url_params)
-    resp = test_client.put(url_binaries, data=small_bytes())
+    resp = default_client.put(url_binaries, data=small_bytes())
     assert resp.status_code == HTTP_422_UNPROCESSABLE_ENTITY
 
     # Upload seeds
     url_seeds = app.url_path_for("upload_revision_seeds", **url_params)
-    resp = test_client.put(url_seeds, data=small_bytes())
+    resp = default_client.put(url_seeds, data=small_bytes())
     assert resp.status_code == HTTP_422_UNPROCESSABLE_ENTITY
 
     # Upload config
     url_config = app.url_path_for("upload_revision_config", **url_params)
-    resp = test_client.put(url_config, data=small_bytes())
+    resp = default_client.put(url_config, data=small_bytes())
     assert resp.status_code == HTTP_422_UNPROCESSABLE_ENTITY
 
 
 def test_upload_files_failed_limit_exceeded(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
     settings: AppSettings,
 ):
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1345,27 +1267,27 @@ def test_upload_files_failed_limit_exceeded(
     # Upload binaries
     upload_limit = settings.revision.binaries_upload_limit
     url_binaries = app.url_path_for("upload_revision_binaries", **url_params)
-    resp = test_client.put(url_binaries, data=big_tar(upload_limit))
+    resp = default_client.put(url_binaries, data=big_tar(upload_limit))
     assert resp.status_code == HTTP_413_REQUEST_ENTITY_TOO_LARGE
 
     # Upload seeds
     upload_limit = settings.revision.seeds_upload_limit
     url_seeds = app.url_path_for("upload_revision_seeds", **url_params)
-    resp = test_client.put(url_seeds, data=big_tar(upload_limit))
+    resp = default_client.put(url_seeds, data=big_tar(upload_limit))
     assert resp.status_code == HTTP_413_REQUEST_ENTITY_TOO_LARGE
 
     # Upload config
     upload_limit = settings.revision.config_upload_limit
     headers = {"Content-Length": str(upload_limit)}
     url_config = app.url_path_for("upload_revision_config", **url_params)
-    resp = test_client.put(url_config, data=big_tar(upload_limit), headers=headers)
+    resp = default_client.put(url_config, data=big_tar(upload_limit), headers=headers)
     assert resp.status_code == HTTP_413_REQUEST_ENTITY_TOO_LARGE
 
 
 def test_download_files_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -1378,14 +1300,9 @@ def test_download_files_ok(
         If download succeeded
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1394,12 +1311,12 @@ def test_download_files_ok(
     def upload_download_compare(name_upload: str, name_download: str, data: bytes):
 
         url_upload = app.url_path_for(name_upload, **url_params)
-        resp = test_client.put(url_upload, data=data)
+        resp = default_client.put(url_upload, data=data)
         assert resp.status_code == HTTP_200_OK
 
         result = bytes()
         url_download = app.url_path_for(name_download, **url_params)
-        with test_client.get(url_download, stream=True) as resp:
+        with default_client.get(url_download, stream=True) as resp:
             assert resp.status_code == HTTP_200_OK
             for chunk in resp.iter_content():
                 result += chunk
@@ -1426,8 +1343,8 @@ def test_download_files_ok(
 
 def test_download_files_not_found(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -1440,36 +1357,32 @@ def test_download_files_not_found(
         If download failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
     }
 
     url = app.url_path_for("download_revision_binaries", **url_params)
-    with test_client.get(url, stream=True) as resp:
+    with default_client.get(url, stream=True) as resp:
         assert resp.status_code == HTTP_404_NOT_FOUND
 
     url = app.url_path_for("download_revision_seeds", **url_params)
-    with test_client.get(url, stream=True) as resp:
+    with default_client.get(url, stream=True) as resp:
         assert resp.status_code == HTTP_404_NOT_FOUND
 
     url = app.url_path_for("download_revision_config", **url_params)
-    with test_client.get(url, stream=True) as resp:
+    with default_client.get(url, stream=True) as resp:
         assert resp.status_code == HTTP_404_NOT_FOUND
 
 
-def test_download_files_not_found_in_s3(
+@pytest.mark.asyncio()
+async def test_download_files_not_found_in_s3(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_image: ORMImage,
@@ -1482,13 +1395,8 @@ def test_download_files_not_found_in_s3(
         If download failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Create revision with custom status
-    revision = create_custom_revision(
+    revision = await create_custom_revision(
         "custom",
         default_fuzzer.id,
         default_image.id,
@@ -1501,29 +1409,30 @@ def test_download_files_not_found_in_s3(
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": revision.id,
     }
 
     url = app.url_path_for("download_revision_binaries", **url_params)
-    with test_client.get(url, stream=True) as resp:
+    with default_client.get(url, stream=True) as resp:
         assert resp.status_code == HTTP_404_NOT_FOUND
 
     url = app.url_path_for("download_revision_seeds", **url_params)
-    with test_client.get(url, stream=True) as resp:
+    with default_client.get(url, stream=True) as resp:
         assert resp.status_code == HTTP_404_NOT_FOUND
 
     url = app.url_path_for("download_revision_config", **url_params)
-    with test_client.get(url, stream=True) as resp:
+    with default_client.get(url, stream=True) as resp:
         assert resp.status_code == HTTP_404_NOT_FOUND
 
 
-def test_switch_start_revision_ok(
+@pytest.mark.asyncio()
+async def test_switch_start_revision_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_image: ORMImage,
@@ -1536,12 +1445,7 @@ def test_switch_start_revision_ok(
         If no errors occurred
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
-    running_revision = create_custom_revision(
+    running_revision = await create_custom_revision(
         "running",
         default_fuzzer.id,
         default_image.id,
@@ -1549,7 +1453,7 @@ def test_switch_start_revision_ok(
         binaries=ORMUploadStatus(uploaded=True),
     )
 
-    rev_to_start = create_custom_revision(
+    rev_to_start = await create_custom_revision(
         "to start",
         default_fuzzer.id,
         default_image.id,
@@ -1559,7 +1463,7 @@ def test_switch_start_revision_ok(
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": rev_to_start.id,
@@ -1567,14 +1471,14 @@ def test_switch_start_revision_ok(
 
     # Start revision(restart for unverified state)
     url_start = app.url_path_for("restart_revision", **url_params)
-    resp = test_client.post(url_start)
+    resp = default_client.post(url_start)
     assert resp.status_code == HTTP_200_OK
 
 
 def test_start_revision_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_revision: ORMRevision,
@@ -1587,14 +1491,9 @@ def test_start_revision_ok(
         If no errors occurred
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": default_revision.id,
@@ -1602,12 +1501,12 @@ def test_start_revision_ok(
 
     # Upload binaries
     url_binaries = app.url_path_for("upload_revision_binaries", **url_params)
-    resp = test_client.put(url_binaries, data=small_tar())
+    resp = default_client.put(url_binaries, data=small_tar())
     assert resp.status_code == HTTP_200_OK
 
     # Start revision(restart for unverified state)
     url_start = app.url_path_for("restart_revision", **url_params)
-    resp = test_client.post(url_start)
+    resp = default_client.post(url_start)
     assert resp.status_code == HTTP_200_OK
 
 
@@ -1667,11 +1566,12 @@ def test_start_revision_failed_not_uploaded(
         ORMRevisionStatus.running,
     ],
 )
-def test_start_revision_failed_bad_status(
+@pytest.mark.asyncio()
+async def test_start_revision_failed_bad_status(
     status: ORMRevisionStatus,
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_image: ORMImage,
@@ -1685,13 +1585,8 @@ def test_start_revision_failed_bad_status(
         If operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Create revision with custom status
-    revision = create_custom_revision(
+    revision = await create_custom_revision(
         "custom",
         default_fuzzer.id,
         default_image.id,
@@ -1701,7 +1596,7 @@ def test_start_revision_failed_bad_status(
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": revision.id,
@@ -1709,7 +1604,7 @@ def test_start_revision_failed_bad_status(
 
     # Start revision (bad status)
     url_start = app.url_path_for("start_revision", **url_params)
-    resp = test_client.post(url_start)
+    resp = default_client.post(url_start)
     json = resp.json()
 
     # Ensure start failed
@@ -1720,10 +1615,11 @@ def test_start_revision_failed_bad_status(
         assert json["code"] == E_REVISION_CAN_ONLY_RESTART
 
 
-def test_stop_revision_ok(
+@pytest.mark.asyncio()
+async def test_stop_revision_ok(
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_image: ORMImage,
@@ -1736,13 +1632,8 @@ def test_stop_revision_ok(
         If no errors encountered
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Create revision to start
-    revision = create_custom_revision(
+    revision = await create_custom_revision(
         "custom",
         default_fuzzer.id,
         default_image.id,
@@ -1752,7 +1643,7 @@ def test_stop_revision_ok(
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": revision.id,
@@ -1760,7 +1651,7 @@ def test_stop_revision_ok(
 
     # Stop revision
     url_start = app.url_path_for("stop_revision", **url_params)
-    assert test_client.post(url_start).status_code == HTTP_200_OK
+    assert default_client.post(url_start).status_code == HTTP_200_OK
 
 
 @pytest.mark.parametrize(
@@ -1770,11 +1661,12 @@ def test_stop_revision_ok(
         ORMRevisionStatus.stopped,
     ],
 )
-def test_stop_revision_failed_bad_status(
+@pytest.mark.asyncio()
+async def test_stop_revision_failed_bad_status(
     status: ORMRevisionStatus,
     app: FastAPI,
-    test_client: TestClient,
-    default_login_data: LoginModel,
+    default_client: TestClient,
+    default_user_id: str,
     default_project: ORMProject,
     default_fuzzer: ORMFuzzer,
     default_image: ORMImage,
@@ -1788,19 +1680,14 @@ def test_stop_revision_failed_bad_status(
         If operation failed
     """
 
-    # Login as default user
-    resp = test_client.post(app.url_path_for("login"), json=default_login_data.dict())
-    assert resp.status_code == HTTP_200_OK
-    json = resp.json()
-
     # Create revision with custom status
-    revision = create_custom_revision(
+    revision = await create_custom_revision(
         "custom", default_fuzzer.id, default_image.id, status=status
     )
 
     # Set url params
     url_params = {
-        "user_id": json["user_id"],
+        "user_id": default_user_id,
         "project_id": default_project.id,
         "fuzzer_id": default_fuzzer.id,
         "revision_id": revision.id,
@@ -1808,7 +1695,7 @@ def test_stop_revision_failed_bad_status(
 
     # Stop revision (bad status)
     url = app.url_path_for("stop_revision", **url_params)
-    resp = test_client.post(url)
+    resp = default_client.post(url)
     json = resp.json()
 
     # Ensure stop failed
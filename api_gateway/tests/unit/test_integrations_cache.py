@@ -0,0 +1,147 @@
+from typing import Dict, List
+
+import pytest
+
+from api_gateway.app.message_queue.utils import IntegrationsCache
+
+
+class IntegrationsMock:
+
+    """Keeps integrations of projects and counts queries"""
+
+    def __init__(self):
+        self.items: Dict[str, List[str]] = {}
+        self.queries: List[str] = []
+
+    async def list_internal(self, project_id: str):
+        async def iterate():
+            for item in self.items.get(project_id, []):
+                yield item
+
+        self.queries.append(project_id)
+        return iterate()
+
+
+class DatabaseMock:
+    def __init__(self):
+        self.integrations = IntegrationsMock()
+
+
+@pytest.mark.asyncio()
+async def test_integrations_cache_hit():
+
+    """
+    Description
+        Get integrations of project several times
+
+    Succeeds
+        If database is queried only once
+    """
+
+    db = DatabaseMock()
+    db.integrations.items["1"] = ["jira", "youtrack"]
+    cache = IntegrationsCache()
+
+    for _ in range(3):
+        assert await cache.get(db, "1") == ("jira", "youtrack")
+
+    assert db.integrations.queries == ["1"]
+
+
+@pytest.mark.asyncio()
+async def test_integrations_cache_invalidate():
+
+    """
+    Description
+        Change integrations of project and invalidate its cache entry
+
+    Succeeds
+        If changed integrations are returned
+        and other projects stay cached
+    """
+
+    db = DatabaseMock()
+    db.integrations.items["1"] = ["jira"]
+    db.integrations.items["2"] = ["youtrack"]
+    cache = IntegrationsCache()
+
+    assert await cache.get(db, "1") == ("jira",)
+    assert await cache.get(db, "2") == ("youtrack",)
+
+    db.integrations.items["1"] = ["jira", "youtrack"]
+    cache.invalidate("1")
+
+    assert await cache.get(db, "1") == ("jira", "youtrack")
+    assert await cache.get(db, "2") == ("youtrack",)
+    assert db.integrations.queries == ["1", "2", "1"]
+
+    # Unknown project is ignored
+    cache.invalidate("3")
+
+
+@pytest.mark.asyncio()
+async def test_integrations_cache_clear():
+
+    """
+    Description
+        Remove integrations of all projects and clear cache
+
+    Succeeds
+        If no integrations are returned for all projects
+    """
+
+    db = DatabaseMock()
+    db.integrations.items["1"] = ["jira"]
+    db.integrations.items["2"] = ["youtrack"]
+    cache = IntegrationsCache()
+
+    await cache.get(db, "1")
+    await cache.get(db, "2")
+
+    db.integrations.items.clear()
+    cache.clear()
+
+    assert await cache.get(db, "1") == ()
+    assert await cache.get(db, "2") == ()
+    assert db.integrations.queries == ["1", "2", "1", "2"]
+
+
+@pytest.mark.asyncio()
+async def test_integrations_cache_expired():
+
+    """
+    Description
+        Get integrations, when cache entries expire at once
+
+    Succeeds
+        If database is queried every time
+    """
+
+    db = DatabaseMock()
+    db.integrations.items["1"] = ["jira"]
+    cache = IntegrationsCache(ttl=0)
+
+    for _ in range(3):
+        assert await cache.get(db, "1") == ("jira",)
+
+    assert db.integrations.queries == ["1", "1", "1"]
+
+
+@pytest.mark.asyncio()
+async def test_integrations_cache_maxsize():
+
+    """
+    Description
+        Get integrations of more projects than cache can hold
+
+    Succeeds
+        If the oldest project is dropped from cache
+    """
+
+    db = DatabaseMock()
+    cache = IntegrationsCache(maxsize=2)
+
+    for project_id in ["1", "2", "3", "3", "2", "1"]:
+        await cache.get(db, project_id)
+
+    assert db.integrations.queries == ["1", "2", "3", "1"]
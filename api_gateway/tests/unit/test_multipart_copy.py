@@ -0,0 +1,190 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import pytest
+from botocore.exceptions import ClientError
+
+from api_gateway.app.object_storage import ObjectStorage, ObjectStorageError
+from api_gateway.app.object_storage import storage as s3_storage
+from api_gateway.app.object_storage.paths import BucketData
+
+PART_SIZE = 10
+
+
+class S3ClientMock:
+
+    """S3 client, which copies objects of given size.
+    Part copy with given number fails, others take a while"""
+
+    def __init__(self, size: int, failed_part: Optional[int] = None):
+        self.size = size
+        self.failed_part = failed_part
+        self.copied_object = False
+        self.copied_ranges: Dict[int, str] = {}
+        self.cancelled_parts: List[int] = []
+        self.completed_parts: Optional[list] = None
+        self.aborted_upload: Optional[str] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def head_object(self, Bucket: str, Key: str):
+        return {"ContentLength": self.size}
+
+    async def copy_object(self, **kwargs):
+        self.copied_object = True
+
+    async def create_multipart_upload(self, Bucket: str, Key: str):
+        return {"UploadId": "upload-id"}
+
+    async def upload_part_copy(
+        self,
+        PartNumber: int,
+        CopySourceRange: str,
+        **kwargs,
+    ):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if PartNumber == self.failed_part:
+                error = {"Error": {"Code": "InternalError", "Message": "Failed"}}
+                raise ClientError(error, "UploadPartCopy")
+
+            await asyncio.sleep(0.01)
+
+        except asyncio.CancelledError:
+            self.cancelled_parts.append(PartNumber)
+            raise
+
+        finally:
+            self.in_flight -= 1
+
+        self.copied_ranges[PartNumber] = CopySourceRange
+        return {"CopyPartResult": {"ETag": f"etag-{PartNumber}"}}
+
+    async def complete_multipart_upload(self, UploadId: str, MultipartUpload, **kwargs):
+        self.completed_parts = MultipartUpload["Parts"]
+
+    async def abort_multipart_upload(self, UploadId: str, **kwargs):
+        self.aborted_upload = UploadId
+
+
+def make_storage(client: S3ClientMock):
+
+    # Storage is not connected to S3, so it's not closed
+    s3 = ObjectStorage.__new__(ObjectStorage)
+    s3._is_closed = True
+    s3._logger = logging.getLogger("s3")
+    s3._client = client
+    s3._bucket_data = BucketData("data")
+    return s3
+
+
+@pytest.fixture(autouse=True)
+def small_parts(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(s3_storage, "COPY_PART_SIZE", PART_SIZE)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("size", [0, 1, PART_SIZE])
+async def test_copy_single_request(size: int):
+
+    """
+    Description
+        Copy object, which fits into one part
+
+    Succeeds
+        If object is copied with one request
+    """
+
+    client = S3ClientMock(size)
+    await make_storage(client).copy_corpus_files("1", "2", "3")
+
+    assert client.copied_object
+    assert client.copied_ranges == {}
+    assert client.completed_parts is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "size, ranges",
+    [
+        (PART_SIZE + 1, ["0-9", "10-10"]),
+        (2 * PART_SIZE, ["0-9", "10-19"]),
+        (2 * PART_SIZE + 5, ["0-9", "10-19", "20-24"]),
+    ],
+)
+async def test_copy_multipart(size: int, ranges: List[str]):
+
+    """
+    Description
+        Copy object, which takes several parts
+
+    Succeeds
+        If parts cover the whole object and
+        upload is completed with all of them in order
+    """
+
+    client = S3ClientMock(size)
+    await make_storage(client).copy_corpus_files("1", "2", "3")
+
+    part_numbers = list(range(1, len(ranges) + 1))
+    assert not client.copied_object
+    assert client.copied_ranges == {
+        i: f"bytes={r}" for i, r in zip(part_numbers, ranges)
+    }
+    assert client.completed_parts == [
+        {"PartNumber": i, "ETag": f"etag-{i}"} for i in part_numbers
+    ]
+    assert client.aborted_upload is None
+
+
+@pytest.mark.asyncio()
+async def test_copy_multipart_concurrency(monkeypatch: pytest.MonkeyPatch):
+
+    """
+    Description
+        Copy object, which takes more parts
+        than can be copied at the same time
+
+    Succeeds
+        If number of parts copied at once is limited
+    """
+
+    monkeypatch.setattr(s3_storage, "COPY_CONCURRENCY", 3)
+
+    client = S3ClientMock(10 * PART_SIZE)
+    await make_storage(client).copy_corpus_files("1", "2", "3")
+
+    assert client.max_in_flight == 3
+    assert len(client.completed_parts) == 10
+
+
+@pytest.mark.asyncio()
+async def test_copy_multipart_abort(monkeypatch: pytest.MonkeyPatch):
+
+    """
+    Description
+        Copy object in parts, while copying of one part fails
+
+    Succeeds
+        If upload is aborted, other parts are
+        cancelled and error is raised
+    """
+
+    monkeypatch.setattr(s3_storage, "COPY_CONCURRENCY", 3)
+
+    client = S3ClientMock(10 * PART_SIZE, failed_part=2)
+    with pytest.raises(ObjectStorageError):
+        await make_storage(client).copy_corpus_files("1", "2", "3")
+
+    assert client.aborted_upload == "upload-id"
+    assert client.completed_parts is None
+
+    # Parts in progress are cancelled, the rest are not started
+    await asyncio.sleep(0.05)
+    assert {1, 3} <= set(client.cancelled_parts)
+    assert len(client.cancelled_parts) < 9
+    assert client.copied_ranges == {}
+    assert client.in_flight == 0
@@ -0,0 +1,212 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import BaseModel
+
+from api_gateway.app.external_api.errors import EAPIServerError
+from api_gateway.app.external_api.interfaces.base import ExternalAPIBase
+
+PG_SIZE = 10
+
+
+class ItemModel(BaseModel):
+    id: int
+
+
+class ItemsAPI(ExternalAPIBase):
+
+    """External API, which returns items page by page"""
+
+    def list_items(self):
+        params = {"pg_size": PG_SIZE}
+        return self.paginate("/items", ItemModel, params=params)
+
+
+class ItemsServer:
+
+    """Serves N items. Pages starting from
+    blocked page wait until they are released"""
+
+    def __init__(self, item_count: int):
+        self.item_count = item_count
+        self.requested_pages = []
+        self.failed_page = None
+        self.blocked_page = None
+        self.unblocked = asyncio.Event()
+
+    async def list_items(self, request: web.Request):
+
+        pg_num = int(request.query["pg_num"])
+        pg_size = int(request.query["pg_size"])
+        self.requested_pages.append(pg_num)
+
+        if pg_num == self.failed_page:
+            error = {"code": "E_INTERNAL_ERROR", "message": "Internal error"}
+            return web.json_response(error, status=500)
+
+        if self.blocked_page is not None and pg_num >= self.blocked_page:
+            await self.unblocked.wait()
+
+        start = pg_num * pg_size
+        end = min(start + pg_size, self.item_count)
+        items = [{"id": i} for i in range(start, end)]
+
+        return web.json_response({"pg_num": pg_num, "pg_size": pg_size, "items": items})
+
+
+def make_server(items_server: ItemsServer):
+    app = web.Application()
+    app.router.add_get("/items", items_server.list_items)
+    return TestServer(app)
+
+
+def fetch_page_tasks():
+    return [
+        task
+        for task in asyncio.all_tasks()
+        if task.get_coro().__qualname__ == "ExternalAPIBase._fetch_page"
+    ]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("item_count", [0, 1, 9, 10, 11, 25, 30])
+async def test_paginate_all_items(item_count: int):
+
+    """
+    Description
+        Iterate over all items, which take
+        different number of full and partial pages
+
+    Succeeds
+        If all items are returned in order and no
+        pages are requested after the last one
+    """
+
+    items_server = ItemsServer(item_count)
+    async with make_server(items_server) as server:
+        api = ItemsAPI(str(server.make_url("")))
+        try:
+            items = [item async for item in api.list_items()]
+        finally:
+            await api.close()
+
+    assert [item.id for item in items] == list(range(item_count))
+
+    # Empty page is fetched only after full page
+    page_count = item_count // PG_SIZE + 1
+    assert items_server.requested_pages == list(range(page_count))
+
+
+@pytest.mark.asyncio()
+async def test_paginate_read_ahead():
+
+    """
+    Description
+        Take items of the first page, while
+        the second page can not be sent yet
+
+    Succeeds
+        If the second page is requested before
+        items of the first page are consumed
+    """
+
+    items_server = ItemsServer(2 * PG_SIZE)
+    items_server.blocked_page = 1
+
+    async with make_server(items_server) as server:
+        api = ItemsAPI(str(server.make_url("")))
+        items = api.list_items()
+
+        try:
+            # Only the first page is available now
+            for i in range(PG_SIZE):
+                item = await items.__anext__()
+                assert item.id == i
+
+            # Let request of the next page reach server
+            for _ in range(100):
+                if len(items_server.requested_pages) > 1:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert items_server.requested_pages == [0, 1]
+            items_server.unblocked.set()
+
+            rest = [item.id async for item in items]
+            assert rest == list(range(PG_SIZE, 2 * PG_SIZE))
+
+        finally:
+            await items.aclose()
+            await api.close()
+
+
+@pytest.mark.asyncio()
+async def test_paginate_stop_cancels_read_ahead():
+
+    """
+    Description
+        Stop iteration, while the next page
+        is being fetched in advance
+
+    Succeeds
+        If fetching of the next page is cancelled
+    """
+
+    items_server = ItemsServer(3 * PG_SIZE)
+    items_server.blocked_page = 1
+
+    async with make_server(items_server) as server:
+        api = ItemsAPI(str(server.make_url("")))
+        items = api.list_items()
+
+        try:
+            item = await items.__anext__()
+            assert item.id == 0
+
+            pending = fetch_page_tasks()
+            assert len(pending) == 1
+            assert not pending[0].done()
+
+            # Consumer stops iteration
+            await items.aclose()
+            await asyncio.sleep(0)
+
+            assert pending[0].cancelled()
+            assert fetch_page_tasks() == []
+
+        finally:
+            items_server.unblocked.set()
+            await api.close()
+
+
+@pytest.mark.asyncio()
+async def test_paginate_read_ahead_error():
+
+    """
+    Description
+        Iterate over items, while fetching
+        of the next page in advance fails
+
+    Succeeds
+        If error is raised after items of the previous page
+    """
+
+    items_server = ItemsServer(3 * PG_SIZE)
+    items_server.failed_page = 1
+
+    async with make_server(items_server) as server:
+        api = ItemsAPI(str(server.make_url("")))
+        received = []
+
+        try:
+            with pytest.raises(EAPIServerError) as e:
+                async for item in api.list_items():
+                    received.append(item.id)
+        finally:
+            await api.close()
+
+    assert e.value.status_code == 500
+    assert received == list(range(PG_SIZE))
+    assert items_server.requested_pages == [0, 1]
@@ -0,0 +1,87 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from api_gateway.app.external_api.errors import EAPIServerError
+from api_gateway.app.external_api.interfaces.base import ExternalAPIBase
+
+
+class ItemsAPI(ExternalAPIBase):
+
+    """External API, which returns no data on success"""
+
+    async def delete_item(self, item_id: str):
+        response = await self._session.delete(f"/items/{item_id}")
+        await self.parse_response_no_model(response)
+
+
+@pytest.fixture()
+async def server():
+
+    peers = []
+
+    async def delete_item(request: web.Request):
+
+        # Remember connection used for request
+        peers.append(request.transport.get_extra_info("peername"))
+
+        if request.match_info["item_id"] == "missing":
+            error = {"code": "E_NOT_FOUND", "message": "Item not found"}
+            return web.json_response(error, status=404)
+
+        # Body is not received at once, so it's left unread
+        return web.Response(body=b"A" * 1024 * 1024)
+
+    app = web.Application()
+    app.router.add_delete("/items/{item_id}", delete_item)
+
+    async with TestServer(app) as test_server:
+        test_server.peers = peers
+        yield test_server
+
+
+@pytest.fixture()
+async def api(server: TestServer):
+    _api = ItemsAPI(str(server.make_url("")))
+    yield _api
+    await _api.close()
+
+
+@pytest.mark.asyncio()
+async def test_no_model_connection_reused(server: TestServer, api: ItemsAPI):
+
+    """
+    Description
+        Make two calls, which return unparsed body on success
+
+    Succeeds
+        If both calls are made over the same connection
+    """
+
+    await api.delete_item("1")
+    await api.delete_item("2")
+
+    assert len(server.peers) == 2
+    assert server.peers[0] == server.peers[1]
+
+
+@pytest.mark.asyncio()
+async def test_no_model_error_raised(server: TestServer, api: ItemsAPI):
+
+    """
+    Description
+        Make call, which returns error
+
+    Succeeds
+        If error sent by server is raised
+    """
+
+    with pytest.raises(EAPIServerError) as e:
+        await api.delete_item("missing")
+
+    assert e.value.status_code == 404
+    assert e.value.error_code == "E_NOT_FOUND"
+
+    # Connection is kept after error as well
+    await api.delete_item("1")
+    assert server.peers[0] == server.peers[1]
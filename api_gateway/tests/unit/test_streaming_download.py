@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+from api_gateway.app.object_storage.storage import StreamingDownload
+
+
+class BodyMock:
+
+    """Body of S3 object. Counts releases of response"""
+
+    def __init__(self, data: bytes, fail_after: int = -1):
+        self.data = data
+        self.fail_after = fail_after
+        self.read_sizes = []
+        self.release_count = 0
+
+    async def read(self, size: int):
+
+        if len(self.read_sizes) == self.fail_after:
+            raise ConnectionResetError()
+
+        self.read_sizes.append(size)
+        chunk, self.data = self.data[:size], self.data[size:]
+        return chunk
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.release_count += 1
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("size", [0, 1, 9, 10, 11, 100])
+async def test_streaming_download_full(size: int):
+
+    """
+    Description
+        Read all chunks of object
+
+    Succeeds
+        If all data is read and response is released once
+    """
+
+    body = BodyMock(b"A" * size)
+    download = StreamingDownload({"Body": body}, chunk_size=10)
+
+    chunks = [chunk async for chunk in download]
+    assert b"".join(chunks) == b"A" * size
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert set(body.read_sizes) == {10}
+    assert body.release_count == 1
+
+    # Closing after the end does nothing
+    await download.aclose()
+    assert body.release_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_streaming_download_aclose():
+
+    """
+    Description
+        Stop reading object before the end
+
+    Succeeds
+        If response is released once
+    """
+
+    body = BodyMock(b"A" * 100)
+    download = StreamingDownload({"Body": body}, chunk_size=10)
+
+    assert await download.__anext__() == b"A" * 10
+    assert body.release_count == 0
+
+    await download.aclose()
+    await download.aclose()
+    assert body.release_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_streaming_download_error():
+
+    """
+    Description
+        Fail while reading object
+
+    Succeeds
+        If error is raised and response is released
+    """
+
+    body = BodyMock(b"A" * 100, fail_after=2)
+    download = StreamingDownload({"Body": body}, chunk_size=10)
+
+    with pytest.raises(ConnectionResetError):
+        async for _ in download:
+            pass
+
+    assert body.release_count == 1
+
+
+@pytest.mark.asyncio()
+async def test_streaming_download_client_disconnected():
+
+    """
+    Description
+        Send object to client, which disconnects
+        before the whole object is sent
+
+    Succeeds
+        If response is released
+    """
+
+    body = BodyMock(b"A" * 1000)
+    download = StreamingDownload({"Body": body}, chunk_size=1)
+    response = StreamingResponse(
+        download,
+        background=BackgroundTask(download.aclose),
+    )
+
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            disconnected.set()
+            await asyncio.sleep(0)
+
+    await response({"type": "http"}, receive, send)
+
+    assert body.data
+    assert body.release_count == 1